@@ -5,16 +5,25 @@ Fully automated script to login, browse, and download songs from Suno AI
 """
 
 import argparse
+import asyncio
+import hashlib
 import json
 import logging
+import math
 import os
+import queue
 import sys
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.chrome.options import Options
@@ -35,12 +44,829 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO timestamp, treating naive values as UTC"""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def clip_to_song(clip: Dict) -> Dict:
+    """
+    Convert a Suno clip object into the song dictionary used throughout
+
+    Mirrors the mapping done in the page JavaScript by extract_songs_data so
+    API listing and browser listing produce identical songs.
+
+    Args:
+        clip: Clip object from the library feed or the page's React props
+
+    Returns:
+        Song dictionary with metadata and URLs
+    """
+    metadata = clip.get("metadata") or {}
+    tags = clip.get("tags") or metadata.get("tags") or []
+    if isinstance(tags, str):
+        tags = [tag.strip() for tag in tags.split(",") if tag.strip()]
+
+    return {
+        "id": clip.get("id") or "",
+        "title": clip["title"].strip() if clip.get("title") else clip.get("id"),
+        "audio_url": clip.get("audio_url") or "",
+        "video_url": clip.get("video_url") or "",
+        "image_url": clip.get("image_url") or "",
+        "created_at": clip.get("created_at") or "",
+        "duration": clip.get("duration") or metadata.get("duration") or 0,
+        "status": clip.get("status") or "",
+        "tags": tags,
+    }
+
+
+def create_http_session(pool_size: int = 10) -> requests.Session:
+    """
+    Create a pooled keep-alive HTTP session
+
+    Args:
+        pool_size: Number of hosts to keep pools for and connections per host
+
+    Returns:
+        Session whose connections are reused across requests
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+
+def connection_stats(session: requests.Session) -> Dict[str, int]:
+    """
+    Count connections opened and reused by a session's connection pools
+
+    Args:
+        session: Session created by create_http_session
+
+    Returns:
+        Dictionary with "opened" and "reused" connection counts
+    """
+    opened = 0
+    requests_made = 0
+
+    for adapter in set(session.adapters.values()):
+        pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+        if pools is None:
+            continue
+        for key in pools.keys():
+            pool = pools[key]
+            opened += pool.num_connections
+            requests_made += pool.num_requests
+
+    return {"opened": opened, "reused": max(0, requests_made - opened)}
+
+
+class PartialDownload:
+    """
+    Journal for a ``.part`` file so interrupted transfers resume with HTTP Range
+
+    Bytes are written to ``<name>.part`` and only renamed to ``<name>`` once the
+    full Content-Length has arrived. When the server advertises
+    ``Accept-Ranges: bytes`` a ``<name>.part.json`` journal records the URL,
+    ETag, Last-Modified and total size, and the next attempt asks for the
+    remaining bytes with ``Range``/``If-Range``. A remote file that changed in
+    the meantime is detected from the response and downloaded from scratch.
+    """
+
+    def __init__(self, filepath: Path):
+        """
+        Initialize the journal
+
+        Args:
+            filepath: Final destination path
+        """
+        self.filepath = filepath
+        self.part_path = filepath.with_name(filepath.name + ".part")
+        self.journal_path = filepath.with_name(filepath.name + ".part.json")
+        self.journal: Dict = {}
+        self.offset = 0
+        self.mode = "wb"
+        self.hasher = hashlib.sha256()
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        """
+        Build request headers, resuming from an existing ``.part`` file if possible
+
+        Args:
+            url: Download URL
+
+        Returns:
+            Headers to send with the GET request
+        """
+        self.journal = self._load_journal()
+        self.offset = 0
+
+        if (
+            self.journal.get("url") != url
+            or not self.part_path.exists()
+            or not (self.journal.get("etag") or self.journal.get("total_size"))
+        ):
+            return {}
+
+        self.offset = self.part_path.stat().st_size
+        if not self.offset:
+            return {}
+
+        headers = {"Range": f"bytes={self.offset}-"}
+        validator = self.journal.get("etag") or self.journal.get("last_modified")
+        if validator:
+            headers["If-Range"] = validator
+        return headers
+
+    def accept(self, url: str, status: int, headers) -> bool:
+        """
+        Validate a response and decide between appending and starting over
+
+        Args:
+            url: Download URL
+            status: HTTP status code of the response
+            headers: Response headers
+
+        Returns:
+            True if the response body can be written, False if the partial
+            file was discarded and the request must be repeated without Range
+        """
+        etag = headers.get("ETag") or ""
+        last_modified = headers.get("Last-Modified") or ""
+
+        if self.offset and status == 416:
+            logger.info(f"Range not satisfiable, restarting: {self.filepath.name}")
+            self.discard()
+            return False
+
+        if self.offset and status == 206:
+            start, total = self._parse_content_range(headers.get("Content-Range"))
+            expected_total = self.journal.get("total_size")
+            expected_etag = self.journal.get("etag")
+            if (
+                start != self.offset
+                or (expected_total and total != expected_total)
+                or (expected_etag and etag and etag != expected_etag)
+            ):
+                logger.info(f"Remote file changed, restarting: {self.filepath.name}")
+                self.discard()
+                return False
+
+            logger.info(f"Resuming {self.filepath.name} from byte {self.offset}")
+            self.mode = "ab"
+            return True
+
+        # Full response: either a fresh download or the server ignored Range
+        self.offset = 0
+        self.mode = "wb"
+        self.journal = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "total_size": self._parse_int(headers.get("Content-Length")),
+        }
+        if (headers.get("Accept-Ranges") or "").lower() == "bytes":
+            self.journal_path.write_text(json.dumps(self.journal))
+        elif self.journal_path.exists():
+            self.journal_path.unlink()
+        return True
+
+    def open(self):
+        """
+        Open the ``.part`` file for writing in append or truncate mode
+
+        Callers feed every written chunk to ``hasher`` as well; when appending,
+        the bytes already on disk are hashed first so ``checksum`` always
+        covers the whole file.
+        """
+        self.hasher = hashlib.sha256()
+        if self.mode == "ab":
+            with open(self.part_path, "rb") as existing:
+                for block in iter(lambda: existing.read(1024 * 1024), b""):
+                    self.hasher.update(block)
+        return open(self.part_path, self.mode)
+
+    @property
+    def checksum(self) -> str:
+        """SHA-256 of the bytes written so far"""
+        return self.hasher.hexdigest()
+
+    def commit(self):
+        """
+        Verify the ``.part`` file is complete and atomically move it into place
+
+        Raises:
+            Exception: If fewer or more bytes than Content-Length were received
+        """
+        total_size = self.journal.get("total_size")
+        size = self.part_path.stat().st_size
+        if total_size and size != total_size:
+            raise Exception(f"Incomplete download: got {size} of {total_size} bytes")
+
+        os.replace(self.part_path, self.filepath)
+        if self.journal_path.exists():
+            self.journal_path.unlink()
+
+    def abort(self):
+        """Keep a resumable ``.part`` file for the next attempt, discard anything else"""
+        total_size = self.journal.get("total_size")
+        resumable = self.journal_path.exists() and self.part_path.exists()
+        if resumable and not (
+            total_size and self.part_path.stat().st_size > total_size
+        ):
+            logger.info(f"Keeping partial file for resume: {self.part_path.name}")
+            return
+        self.discard()
+
+    def discard(self):
+        """Remove the ``.part`` file and its journal"""
+        for path in (self.part_path, self.journal_path):
+            if path.exists():
+                path.unlink()
+        self.journal = {}
+        self.offset = 0
+        self.mode = "wb"
+
+    def _load_journal(self) -> Dict:
+        """Read the journal left behind by an interrupted download"""
+        try:
+            return json.loads(self.journal_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _parse_int(value) -> Optional[int]:
+        """Parse a numeric header value, returning None if absent or invalid"""
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    @classmethod
+    def _parse_content_range(cls, value) -> Tuple[Optional[int], Optional[int]]:
+        """Parse ``bytes start-end/total`` into (start, total)"""
+        try:
+            unit_range, total = str(value).split("/")
+            start = unit_range.split()[-1].split("-")[0]
+            return cls._parse_int(start), cls._parse_int(total)
+        except ValueError:
+            return None, None
+
+
+class DownloadManifest:
+    """
+    Append-only JSONL index of completed downloads, keyed by clip ID
+
+    Each completed file appends a ``file`` record (ID, format, path, size,
+    SHA-256, URL) and each run appends a ``run`` record. Loading replays the
+    log so the latest record wins, giving constant-time "is this clip already
+    downloaded?" checks and collision-free filenames for songs that share a
+    title.
+    """
+
+    FILENAME = ".suno_manifest.jsonl"
+
+    def __init__(self, download_dir: Path):
+        """
+        Initialize the manifest
+
+        Args:
+            download_dir: Directory holding the downloads and the manifest file
+        """
+        self.download_dir = download_dir
+        self.path = download_dir / self.FILENAME
+        self.entries: Dict[Tuple[str, str], Dict] = {}
+        self.owners: Dict[str, str] = {}
+        self.runs: List[Dict] = []
+        self.superseded = 0
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Replay the manifest log into memory"""
+        self.entries = {}
+        self.owners = {}
+        self.runs = []
+        self.superseded = 0
+
+        if not self.path.exists():
+            return
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    logger.warning(f"Skipping corrupt manifest line: {line.strip()}")
+                    continue
+
+                if record.get("type") == "run":
+                    self.runs.append(record)
+                elif record.get("type") == "file":
+                    key = (record["id"], record["format"])
+                    if key in self.entries:
+                        self.superseded += 1
+                    self.entries[key] = record
+                    self.owners[record["path"]] = record["id"]
+
+        logger.info(f"Loaded manifest with {len(self.entries)} files: {self.path}")
+
+    def get(self, clip_id: str, file_type: str) -> Optional[Dict]:
+        """Get the latest record for a clip's format"""
+        return self.entries.get((clip_id, file_type))
+
+    def is_complete(self, clip_id: str, file_type: str, url: str) -> bool:
+        """
+        Check whether a clip's format is downloaded and unchanged
+
+        Args:
+            clip_id: Suno clip ID
+            file_type: Format (mp3, mp4, wav)
+            url: Current remote URL
+
+        Returns:
+            True if the manifest has the same URL and the file on disk still
+            has the recorded size
+        """
+        entry = self.get(clip_id, file_type)
+        if not entry or entry.get("url") != url:
+            return False
+
+        try:
+            return (self.download_dir / entry["path"]).stat().st_size == entry["size"]
+        except OSError:
+            return False
+
+    def claim(self, clip_id: str, file_type: str, filename: str) -> str:
+        """
+        Reserve a filename for a clip, disambiguating titles shared by clips
+
+        Args:
+            clip_id: Suno clip ID
+            file_type: Format (mp3, mp4, wav)
+            filename: Preferred filename derived from the title
+
+        Returns:
+            The recorded filename if the clip was downloaded before, otherwise
+            ``filename`` or, if another clip already owns it, the filename
+            with the clip ID appended
+        """
+        with self._lock:
+            entry = self.entries.get((clip_id, file_type))
+            if entry:
+                return entry["path"]
+
+            owner = self.owners.get(filename)
+            if owner is not None and owner != clip_id:
+                stem, ext = os.path.splitext(filename)
+                filename = f"{stem} {clip_id}{ext}"
+
+            self.owners[filename] = clip_id
+            return filename
+
+    def record(
+        self,
+        clip_id: str,
+        file_type: str,
+        filename: str,
+        url: str,
+        checksum: Optional[str] = None,
+    ):
+        """
+        Append a completed download
+
+        Args:
+            clip_id: Suno clip ID
+            file_type: Format (mp3, mp4, wav)
+            filename: Filename inside the download directory
+            url: Remote URL the file was fetched from
+            checksum: SHA-256 of the file, computed from disk if omitted
+        """
+        filepath = self.download_dir / filename
+        if checksum is None:
+            hasher = hashlib.sha256()
+            with open(filepath, "rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    hasher.update(block)
+            checksum = hasher.hexdigest()
+
+        entry = {
+            "type": "file",
+            "id": clip_id,
+            "format": file_type,
+            "path": filename,
+            "size": filepath.stat().st_size,
+            "sha256": checksum,
+            "url": url,
+            "downloaded_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+        with self._lock:
+            if (clip_id, file_type) in self.entries:
+                self.superseded += 1
+            self.entries[(clip_id, file_type)] = entry
+            self.owners[filename] = clip_id
+            self._append(entry)
+
+    def record_run(self, started_at: str, results: Dict[str, Dict[str, bool]]):
+        """
+        Append a summary of a finished run
+
+        Args:
+            started_at: ISO timestamp of when the run started
+            results: Per-song, per-format download status
+        """
+        failed_ids = sorted(
+            song_id for song_id, formats in results.items() if not any(formats.values())
+        )
+        entry = {
+            "type": "run",
+            "started_at": started_at,
+            "finished_at": datetime.now(timezone.utc).isoformat(),
+            "success": len(results) - len(failed_ids),
+            "failed": len(failed_ids),
+            "failed_ids": failed_ids,
+        }
+
+        with self._lock:
+            self.runs.append(entry)
+            self._append(entry)
+
+    def last_run(self) -> Optional[Dict]:
+        """Get the most recent run record"""
+        return self.runs[-1] if self.runs else None
+
+    def compact(self):
+        """Rewrite the log without superseded file records"""
+        with self._lock:
+            if not self.superseded:
+                return
+
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for entry in list(self.entries.values()) + self.runs:
+                    f.write(json.dumps(entry) + "\n")
+            os.replace(tmp_path, self.path)
+            logger.info(f"Compacted manifest, dropped {self.superseded} stale records")
+            self.superseded = 0
+
+    def _append(self, entry: Dict):
+        """Append one record to the log (caller holds the lock)"""
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+
+class SessionCache:
+    """
+    Permissions-restricted on-disk cache of the authenticated browser cookies
+
+    The file is created with mode 0600 inside a 0700 directory and written
+    atomically. Cookies are stored with the username they belong to, and
+    expired cookies are dropped on load.
+    """
+
+    def __init__(self, path: str, username: str):
+        """
+        Initialize the cache
+
+        Args:
+            path: Cache file path (``~`` is expanded)
+            username: Account the cached session belongs to
+        """
+        self.path = Path(os.path.expanduser(path))
+        self.username = username
+
+    def load(self) -> Optional[List[Dict]]:
+        """
+        Read cached cookies
+
+        Returns:
+            Unexpired cookies in Selenium's cookie format, or None if there is
+            no usable cache for this username
+        """
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        if data.get("username") != self.username:
+            return None
+
+        now = time.time()
+        cookies = [
+            c
+            for c in data.get("cookies", [])
+            if c.get("expiry") is None or c["expiry"] > now
+        ]
+        return cookies or None
+
+    def save(self, cookies: List[Dict]):
+        """
+        Write cookies readable only by the current user
+
+        Args:
+            cookies: Cookies as returned by the driver's get_cookies()
+        """
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                {
+                    "username": self.username,
+                    "saved_at": time.time(),
+                    "cookies": cookies,
+                },
+                f,
+            )
+        os.replace(tmp_path, self.path)
+        logger.info(f"Saved session cookies to {self.path}")
+
+    def clear(self):
+        """Remove the cache file"""
+        if self.path.exists():
+            self.path.unlink()
+
+
+class PhaseTimer:
+    """Wall time spent in each phase of a run, and how much of it was spent waiting"""
+
+    def __init__(self):
+        self.elapsed: Dict[str, float] = {}
+        self.waited: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the enclosed block as (part of) the named phase"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.elapsed[name] = (
+                self.elapsed.get(name, 0.0) + time.perf_counter() - start
+            )
+
+    def add_wait(self, name: str, seconds: float):
+        """Attribute time spent waiting on a page condition to a phase"""
+        self.waited[name] = self.waited.get(name, 0.0) + seconds
+
+    def report(self) -> List[str]:
+        """One line per phase, in the order the phases ran"""
+        names = list(self.elapsed) + [n for n in self.waited if n not in self.elapsed]
+        return [
+            f"{name}: {self.elapsed.get(name, 0.0):.2f}s "
+            f"(waited {self.waited.get(name, 0.0):.2f}s)"
+            for name in names
+        ]
+
+
+class GenerationTracker:
+    """Waits for many clips to finish generating, polling them all at once"""
+
+    def __init__(
+        self,
+        poll: Callable[[Set[str]], Dict[str, Dict]],
+        interval: float = 10,
+        max_interval: float = 60,
+        max_wait_time: float = 300,
+    ):
+        """
+        Initialize the tracker
+
+        Args:
+            poll: Callable taking the pending clip IDs and returning the
+                current song dictionaries it found, keyed by ID
+            interval: Seconds before the first poll, and after any poll that
+                saw a clip complete
+            max_interval: Upper bound for the exponentially growing interval
+            max_wait_time: Give up on clips still pending after this long
+        """
+        self.poll = poll
+        self.interval = interval
+        self.max_interval = max_interval
+        self.max_wait_time = max_wait_time
+        self.pending: Dict[str, Dict] = {}
+
+    def add(self, song: Dict):
+        """Start tracking a song that is still generating"""
+        self.pending[song["id"]] = song
+
+    def run(self, release: Callable[[Dict], None]) -> List[Dict]:
+        """
+        Poll until every tracked song is complete or the wait times out
+
+        Args:
+            release: Called with the updated song dictionary as soon as a
+                song completes, and with the last known state of songs
+                that timed out
+
+        Returns:
+            Songs that timed out
+        """
+        start_time = time.time()
+        interval = self.interval
+
+        while self.pending and time.time() - start_time < self.max_wait_time:
+            logger.info(
+                f"Waiting for {len(self.pending)} songs to finish generating... "
+                f"({int(time.time() - start_time)}s elapsed)"
+            )
+            time.sleep(interval)
+
+            try:
+                updates = self.poll(set(self.pending))
+            except Exception as e:
+                logger.warning(f"Generation status check failed: {str(e)}")
+                updates = {}
+
+            completed = []
+            for song_id, song in updates.items():
+                if song_id not in self.pending:
+                    continue
+                if song.get("status", "").lower() == "complete":
+                    completed.append(song)
+                    del self.pending[song_id]
+                else:
+                    self.pending[song_id] = song
+                    logger.info(f"Status of {song['title']}: {song.get('status')}")
+
+            for song in completed:
+                logger.info(f"Generation complete for: {song['title']}")
+                release(song)
+
+            # Back off while nothing changes, poll promptly again after progress
+            interval = (
+                self.interval if completed else min(interval * 2, self.max_interval)
+            )
+
+        timed_out = list(self.pending.values())
+        self.pending.clear()
+        for song in timed_out:
+            logger.warning(f"Generation timeout for song: {song['title']}")
+            release(song)
+        return timed_out
+
+
+class DownloadEngine:
+    """Bounded pool of worker threads that download (song, format) jobs from a queue"""
+
+    def __init__(
+        self,
+        download_func: Callable[[str, str, str], bool],
+        workers: int = 4,
+        per_host_limit: int = 4,
+    ):
+        """
+        Initialize the engine
+
+        Args:
+            download_func: Callable taking (url, filename, file_type, clip_id)
+                and returning success
+            workers: Number of worker threads pulling jobs from the queue
+            per_host_limit: Maximum concurrent transfers against a single host
+        """
+        self.download_func = download_func
+        self.workers = max(1, workers)
+        self.per_host_limit = max(1, per_host_limit)
+        self.jobs: "queue.Queue[Optional[Tuple[str, str, str, str]]]" = queue.Queue()
+        self.results: Dict[str, Dict[str, bool]] = {}
+        self._lock = threading.Lock()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._threads: List[threading.Thread] = []
+        self.started_at: Optional[float] = None
+        self.first_file_at: Optional[float] = None
+
+    def start(self):
+        """Start the worker threads"""
+        self.started_at = time.monotonic()
+        for i in range(self.workers):
+            thread = threading.Thread(
+                target=self._worker, name=f"download-worker-{i + 1}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Started {self.workers} download workers")
+
+    def track(self, song_id: str):
+        """Register a song so it is accounted for even if it has no jobs"""
+        with self._lock:
+            self.results.setdefault(song_id, {})
+
+    def submit(self, song_id: str, file_type: str, url: str, filename: str):
+        """Queue a single (song, format) download job"""
+        self.track(song_id)
+        self.jobs.put((song_id, file_type, url, filename))
+
+    def join(self) -> Dict[str, Dict[str, bool]]:
+        """
+        Wait for all queued jobs to finish and stop the workers
+
+        Returns:
+            Dictionary mapping song ID to per-format download status
+        """
+        for _ in self._threads:
+            self.jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        return self.results
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Get the concurrency slot shared by all jobs against the URL's host"""
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._host_slots[host]
+
+    def _worker(self):
+        """Pull jobs from the queue until a stop sentinel is received"""
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+
+            song_id, file_type, url, filename = job
+            try:
+                with self._host_slot(url):
+                    success = self.download_func(url, filename, file_type, song_id)
+            except Exception as e:
+                logger.error(f"Worker failed on {filename}: {str(e)}")
+                success = False
+
+            with self._lock:
+                self.results[song_id][file_type] = success
+                if success and self.first_file_at is None:
+                    self.first_file_at = time.monotonic()
+
+
 class SunoDownloader:
     """Automated downloader for Suno AI songs"""
 
     SUNO_URL = "https://suno.com"
     LOGIN_URL = "https://suno.com/login"
     LIBRARY_URL = "https://suno.com/songs"
+    API_URL = "https://studio-api.prod.suno.com"
+    FEED_PATH = "/api/feed/v2"
+    SESSION_COOKIE = "__session"
+
+    # Upper bounds (seconds) for the condition-based page waits
+    DEFAULT_TIMEOUTS = {
+        "element": 20,  # login form fields and the songs grid appearing
+        "login": 30,  # leaving the login page after submitting
+        "scroll": 10,  # clip count unchanged this long = whole library loaded
+        "idle": 10,  # network going quiet after a refresh
+    }
+    POLL_INTERVAL = 0.25
+
+    # Idle once the document has loaded and no new resource was fetched
+    # since the previous poll
+    NETWORK_IDLE_JS = """
+        const count = performance.getEntriesByType('resource').length;
+        const idle = document.readyState === 'complete'
+            && window.__sunoResourceCount === count;
+        window.__sunoResourceCount = count;
+        return idle;
+    """
+
+    # Number of clips in the grid's React collection (rendered rows as a
+    # fallback), which grows as scrolling pages in more of the library
+    CLIP_COUNT_JS = """
+        const grid = document.querySelector('[role="grid"]');
+        if (!grid) return 0;
+        let clipCount = grid.querySelectorAll('[role="row"]').length;
+        try {
+            const key = Object.keys(grid).find(k => k.startsWith('__reactProps'));
+            const collection = grid[key].children[0].props.values[0][1].collection;
+            clipCount = collection.size !== undefined ? collection.size : collection.length;
+        } catch (e) {}
+        return clipCount;
+    """
+
+    # Scroll the grid's own scroll container (falling back to the document)
+    # down by arguments[0] viewports, or back to the top when it is 0
+    SCROLL_GRID_JS = """
+        let el = document.querySelector('[role="grid"]');
+        while (el && el !== document.body) {
+            const overflow = getComputedStyle(el).overflowY;
+            if ((overflow === 'auto' || overflow === 'scroll')
+                    && el.scrollHeight > el.clientHeight) break;
+            el = el.parentElement;
+        }
+        if (!el || el === document.body) {
+            el = document.scrollingElement || document.documentElement;
+        }
+        el.scrollTop = arguments[0] > 0
+            ? Math.min(el.scrollTop + el.clientHeight * arguments[0], el.scrollHeight)
+            : 0;
+    """
+    MAX_SCROLL_JUMP = 8  # viewports per scroll once clips arrive steadily
 
     def __init__(
         self,
@@ -49,6 +875,16 @@ class SunoDownloader:
         download_dir: str = "downloads",
         headless: bool = False,
         formats: List[str] = None,
+        workers: int = 1,
+        per_host_limit: int = 4,
+        pool_size: int = 10,
+        engine: str = "threads",
+        listing: str = "browser",
+        session_cache: Optional[str] = None,
+        timeouts: Optional[Dict[str, float]] = None,
+        max_scroll_attempts: Optional[int] = None,
+        pipeline: bool = False,
+        max_wait_time: float = 300,
     ):
         """
         Initialize the downloader
@@ -59,6 +895,23 @@ class SunoDownloader:
             download_dir: Directory to save downloaded files
             headless: Run browser in headless mode
             formats: List of formats to download (mp3, mp4, wav)
+            workers: Number of concurrent download workers (1 = serial)
+            per_host_limit: Maximum concurrent downloads against a single host
+            pool_size: Keep-alive connections kept open per host
+            engine: Download engine - "threads" (worker pool, serial when
+                workers is 1) or "async" (single-threaded asyncio transfers)
+            listing: How to list the library - "browser" (scroll the songs
+                page) or "api" (page through the library feed over HTTP)
+            session_cache: Path of a cookie cache that lets repeat runs skip
+                the browser login; None disables caching
+            timeouts: Overrides for DEFAULT_TIMEOUTS (element, login, scroll,
+                idle), the most each page wait may take
+            max_scroll_attempts: Stop scrolling the library after this many
+                scrolls; None scrolls until the clip count stops growing
+            pipeline: Start downloading songs as soon as listing finds them
+                instead of after the whole library has been listed
+            max_wait_time: Maximum seconds to wait for songs to finish
+                generating
         """
         self.username = username
         self.password = password
@@ -67,9 +920,27 @@ class SunoDownloader:
         self.formats = formats or ["mp3", "mp4", "wav"]
         self.driver = None
         self.headless = headless
+        self.workers = max(1, workers)
+        self.per_host_limit = max(1, per_host_limit)
+        self.session = create_http_session(max(pool_size, self.workers))
+        self.engine = engine
+        self.listing = listing
+        self.session_cache = (
+            SessionCache(session_cache, username) if session_cache else None
+        )
+        self._session_cookies: Optional[List[Dict]] = None
+        self.manifest = DownloadManifest(self.download_dir)
+        self.timeouts = {**self.DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.timings = PhaseTimer()
+        self.max_scroll_attempts = max_scroll_attempts
+        self.pipeline = pipeline
+        self.max_wait_time = max_wait_time
+        if pipeline and engine == "async":
+            logger.warning("Pipeline mode downloads with the threads engine")
 
         logger.info(
-            f"Initialized downloader - Download dir: {self.download_dir}, Formats: {self.formats}"
+            f"Initialized downloader - Download dir: {self.download_dir}, "
+            f"Formats: {self.formats}, Workers: {self.workers}, Engine: {self.engine}"
         )
 
     def setup_driver(self):
@@ -105,17 +976,55 @@ class SunoDownloader:
         chrome_options.add_experimental_option("prefs", prefs)
 
         self.driver = webdriver.Chrome(options=chrome_options)
-        self.wait = WebDriverWait(self.driver, 20)
+        self.wait = WebDriverWait(self.driver, self.timeouts["element"])
 
         logger.info("Chrome WebDriver initialized successfully")
 
+    def _wait_until(
+        self, condition: Callable[[], object], timeout: float, phase: str
+    ) -> object:
+        """
+        Poll a page condition until it holds or the timeout passes
+
+        Args:
+            condition: Callable returning a truthy value once satisfied
+            timeout: Upper bound in seconds
+            phase: Phase the waiting time is reported under
+
+        Returns:
+            The condition's truthy value, or None on timeout
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        polls = max(1, math.ceil(timeout / self.POLL_INTERVAL))
+
+        try:
+            for _ in range(polls + 1):
+                value = condition()
+                if value:
+                    return value
+                if time.monotonic() >= deadline:
+                    break
+                time.sleep(self.POLL_INTERVAL)
+            return None
+        finally:
+            self.timings.add_wait(phase, time.monotonic() - start)
+
+    def _wait_for_network_idle(self, phase: str) -> bool:
+        """Wait until the page has loaded and stopped fetching resources"""
+        idle = self._wait_until(
+            lambda: self.driver.execute_script(self.NETWORK_IDLE_JS),
+            self.timeouts["idle"],
+            phase,
+        )
+        return bool(idle)
+
     def login(self):
         """Login to Suno AI"""
         logger.info("Attempting to login to Suno AI...")
 
         try:
             self.driver.get(self.LOGIN_URL)
-            time.sleep(3)
 
             # Wait for login form to load
             logger.info("Waiting for login form...")
@@ -205,11 +1114,15 @@ class SunoDownloader:
             login_button.click()
             logger.info("Clicked login button")
 
-            # Wait for navigation after login
-            time.sleep(5)
+            # Wait for navigation away from the login page
+            left_login = self._wait_until(
+                lambda: "login" not in self.driver.current_url.lower(),
+                self.timeouts["login"],
+                "login",
+            )
 
             # Check if login was successful
-            if "login" not in self.driver.current_url.lower():
+            if left_login:
                 logger.info("Login successful!")
                 return True
             else:
@@ -224,7 +1137,6 @@ class SunoDownloader:
         """Navigate to the songs library"""
         logger.info("Navigating to songs library...")
         self.driver.get(self.LIBRARY_URL)
-        time.sleep(3)
 
         # Wait for the songs grid to load
         try:
@@ -237,36 +1149,86 @@ class SunoDownloader:
 
     def scroll_to_load_all_songs(self):
         """Scroll down to load all songs (lazy loading)"""
+        for _ in self._scroll_library():
+            pass
+
+    def _scroll_library(self) -> Iterator[int]:
+        """
+        Scroll the songs grid until its clip collection stops growing
+
+        Jumps grow while clips keep arriving; when a scroll brings nothing
+        new the wait for it backs off exponentially, and loading ends once
+        the count has been stable for the "scroll" timeout.
+
+        Yields:
+            The clip count before the first scroll and after every scroll
+            that loaded more clips
+        """
         logger.info("Scrolling to load all songs...")
 
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
+        start = time.monotonic()
+        count = self._clip_count()
+        yield count
+        jump = 1
+        backoff = self.POLL_INTERVAL
+        stable_for = 0.0
         scroll_attempts = 0
-        max_attempts = 20
 
-        while scroll_attempts < max_attempts:
-            # Scroll down
-            self.driver.execute_script(
-                "window.scrollTo(0, document.body.scrollHeight);"
+        while (
+            self.max_scroll_attempts is None
+            or scroll_attempts < self.max_scroll_attempts
+        ):
+            self.driver.execute_script(self.SCROLL_GRID_JS, jump)
+            scroll_attempts += 1
+
+            new_count = self._wait_until(
+                lambda: self._grown_count(count), backoff, "listing"
             )
-            time.sleep(2)
 
-            # Calculate new scroll height
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
+            if new_count is None:
+                stable_for += backoff
+                if stable_for >= self.timeouts["scroll"]:
+                    logger.info(f"Clip count stable for {stable_for:.1f}s")
+                    break
+                backoff = min(backoff * 2, self.timeouts["scroll"] - stable_for)
+                continue
+
+            count = new_count
+            stable_for = 0.0
+            backoff = self.POLL_INTERVAL
+            jump = min(jump * 2, self.MAX_SCROLL_JUMP)
+            elapsed = time.monotonic() - start
+            logger.info(
+                f"Scrolled {scroll_attempts} times, {count} clips loaded "
+                f"({count / max(elapsed, 1e-6):.1f} clips/s)"
+            )
+            yield count
+        else:
+            logger.warning(
+                f"Stopped after {scroll_attempts} scroll attempts before the "
+                f"clip count settled; raise --max-scroll-attempts to load more"
+            )
 
-            if new_height == last_height:
-                logger.info("Reached end of page")
-                break
+        # Scroll back to top
+        self.driver.execute_script(self.SCROLL_GRID_JS, 0)
+        elapsed = time.monotonic() - start
+        logger.info(
+            f"Finished loading {count} clips in {elapsed:.1f}s "
+            f"({count / max(elapsed, 1e-6):.1f} clips/s)"
+        )
 
-            last_height = new_height
-            scroll_attempts += 1
-            logger.info(f"Scrolled {scroll_attempts} times...")
+    def _clip_count(self) -> int:
+        """Number of clips currently loaded into the songs grid"""
+        return int(self.driver.execute_script(self.CLIP_COUNT_JS) or 0)
 
-        # Scroll back to top
-        self.driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(1)
-        logger.info("Finished loading all songs")
+    def _grown_count(self, last_count: int) -> Optional[int]:
+        """The clip count if it grew past last_count, otherwise None"""
+        count = self._clip_count()
+        return count if count > last_count else None
 
-    def extract_songs_data(self, filter_criteria: Optional[Dict] = None) -> List[Dict]:
+    def extract_songs_data(
+        self, filter_criteria: Optional[Dict] = None, offset: int = 0
+    ) -> List[Dict]:
         """
         Extract songs data from the page using JavaScript
 
@@ -277,6 +1239,8 @@ class SunoDownloader:
                 - max_date: Filter by maximum creation date
                 - has_video: Filter for songs with video
                 - has_audio: Filter for songs with audio
+            offset: Skip this many entries of the grid's collection (those
+                already extracted while scrolling)
 
         Returns:
             List of song dictionaries with metadata and URLs
@@ -295,6 +1259,7 @@ class SunoDownloader:
             const songs = grid[reactPropsKey].children[0].props.values[0][1].collection;
 
             return [...songs]
+                .slice(arguments[0] || 0)
                 .filter(x => x.value && x.value.clip && x.value.clip.clip)
                 .map(x => {
                     const clip = x.value.clip.clip;
@@ -316,7 +1281,7 @@ class SunoDownloader:
         }
         """
 
-        songs = self.driver.execute_script(js_script)
+        songs = self.driver.execute_script(js_script, offset)
         logger.info(f"Extracted {len(songs)} songs from page")
 
         # Apply filters
@@ -326,48 +1291,302 @@ class SunoDownloader:
 
         return songs
 
-    def _apply_filters(self, songs: List[Dict], criteria: Dict) -> List[Dict]:
-        """Apply filter criteria to songs list"""
-        filtered = songs
-
-        # Filter by title
-        if criteria.get("title"):
-            title_filter = criteria["title"].lower()
-            filtered = [s for s in filtered if title_filter in s["title"].lower()]
-            logger.info(
-                f"Filtered by title '{criteria['title']}': {len(filtered)} songs"
-            )
+    def harvest_auth(self) -> Dict[str, str]:
+        """
+        Copy the logged-in browser session onto the HTTP session
 
-        # Filter by date range
-        if criteria.get("min_date"):
-            min_date = datetime.fromisoformat(criteria["min_date"])
-            filtered = [
-                s
-                for s in filtered
-                if s.get("created_at")
-                and datetime.fromisoformat(s["created_at"].replace("Z", "+00:00"))
-                >= min_date
-            ]
-            logger.info(f"Filtered by min_date: {len(filtered)} songs")
+        Returns:
+            Cookies taken from the driver, by name
+        """
+        cookies = self._apply_cookies(self.driver.get_cookies())
+        logger.info(f"Harvested {len(cookies)} session cookies from browser")
+        return cookies
 
-        if criteria.get("max_date"):
-            max_date = datetime.fromisoformat(criteria["max_date"])
-            filtered = [
-                s
-                for s in filtered
-                if s.get("created_at")
-                and datetime.fromisoformat(s["created_at"].replace("Z", "+00:00"))
-                <= max_date
-            ]
-            logger.info(f"Filtered by max_date: {len(filtered)} songs")
+    def _apply_cookies(self, cookie_list: List[Dict]) -> Dict[str, str]:
+        """
+        Authenticate the HTTP session with browser cookies
 
-        # Filter by has_video
-        if criteria.get("has_video") is not None:
-            if criteria["has_video"]:
-                filtered = [s for s in filtered if s.get("video_url")]
-            else:
-                filtered = [s for s in filtered if not s.get("video_url")]
-            logger.info(f"Filtered by has_video: {len(filtered)} songs")
+        Args:
+            cookie_list: Cookies in Selenium's cookie format
+
+        Returns:
+            Cookie values by name
+        """
+        cookies = {c["name"]: c["value"] for c in cookie_list}
+        self.session.cookies.update(cookies)
+
+        token = cookies.get(self.SESSION_COOKIE)
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+        else:
+            logger.warning(f"No {self.SESSION_COOKIE} cookie found")
+
+        return cookies
+
+    def validate_session(self) -> bool:
+        """
+        Check with a single feed request that the HTTP session is authenticated
+
+        Returns:
+            True if the library feed accepts the session
+        """
+        try:
+            response = self.session.get(
+                f"{self.API_URL}{self.FEED_PATH}", params={"page": 0}, timeout=10
+            )
+            return response.status_code == 200
+        except Exception as e:
+            logger.info(f"Session validation failed: {str(e)}")
+            return False
+
+    def restore_session(self) -> bool:
+        """
+        Reuse cached cookies instead of logging in through the browser
+
+        Returns:
+            True if cached cookies were found and the feed accepted them
+        """
+        if not self.session_cache:
+            return False
+
+        cookies = self.session_cache.load()
+        if not cookies:
+            logger.info("No cached session, logging in through the browser")
+            return False
+
+        self._apply_cookies(cookies)
+        if not self.validate_session():
+            logger.info("Cached session expired, logging in through the browser")
+            self.session_cache.clear()
+            self.session.cookies.clear()
+            self.session.headers.pop("Authorization", None)
+            return False
+
+        logger.info("Reusing cached session, skipping browser login")
+        self._session_cookies = cookies
+        return True
+
+    def _ensure_browser(self):
+        """Launch Chrome on demand when a restored session skipped the login"""
+        if self.driver or self._session_cookies is None:
+            return
+
+        self.setup_driver()
+        self.driver.get(self.SUNO_URL)
+        for cookie in self._session_cookies or []:
+            try:
+                self.driver.add_cookie(
+                    {
+                        key: cookie[key]
+                        for key in (
+                            "name",
+                            "value",
+                            "domain",
+                            "path",
+                            "secure",
+                            "expiry",
+                        )
+                        if key in cookie
+                    }
+                )
+            except Exception as e:
+                logger.debug(f"Skipping cookie {cookie.get('name')}: {str(e)}")
+
+    def _fetch_feed_page(self, page: int) -> Tuple[List[Dict], Optional[int]]:
+        """
+        Fetch one page of the library feed
+
+        Args:
+            page: Zero-based page number
+
+        Returns:
+            Tuple of (songs on the page, total clip count if reported)
+        """
+        response = self.session.get(
+            f"{self.API_URL}{self.FEED_PATH}", params={"page": page}, timeout=30
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        if isinstance(data, list):
+            return [clip_to_song(clip) for clip in data], None
+
+        clips = data.get("clips") or []
+        return [clip_to_song(clip) for clip in clips], data.get("num_total_results")
+
+    def iter_library_api(self) -> Iterator[List[Dict]]:
+        """
+        Page through the library feed over HTTP
+
+        The first page reveals the page size and total; remaining pages are
+        then fetched ``workers`` at a time and yielded in page order. Feeds
+        that do not report a total are paged sequentially until empty.
+
+        Yields:
+            Lists of song dictionaries, one per page
+        """
+        songs, total = self._fetch_feed_page(0)
+        if not songs:
+            return
+        yield songs
+
+        page_size = len(songs)
+        if total is None:
+            page = 1
+            while True:
+                songs, _ = self._fetch_feed_page(page)
+                if not songs:
+                    return
+                yield songs
+                page += 1
+
+        pages = range(1, -(-total // page_size))
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for songs, _ in executor.map(self._fetch_feed_page, pages):
+                yield songs
+
+    def list_songs_api(self, filter_criteria: Optional[Dict] = None) -> List[Dict]:
+        """
+        List the library through the feed API instead of scrolling the page
+
+        Args:
+            filter_criteria: Same filter options as extract_songs_data
+
+        Returns:
+            List of song dictionaries, de-duplicated by clip ID
+        """
+        logger.info("Listing songs through the library API...")
+        start_time = time.time()
+
+        songs: Dict[str, Dict] = {}
+        for batch in self.iter_library_api():
+            for song in batch:
+                songs.setdefault(song["id"], song)
+
+        songs_list = list(songs.values())
+        logger.info(
+            f"Listed {len(songs_list)} songs via API in "
+            f"{time.time() - start_time:.1f}s"
+        )
+
+        if filter_criteria:
+            songs_list = self._apply_filters(songs_list, filter_criteria)
+            logger.info(f"After filtering: {len(songs_list)} songs remain")
+
+        return songs_list
+
+    def list_songs(self, filter_criteria: Optional[Dict] = None) -> List[Dict]:
+        """
+        List the library with the configured listing mode
+
+        API listing falls back to scrolling the page if the feed request fails.
+
+        Args:
+            filter_criteria: Dictionary with filter options
+
+        Returns:
+            List of song dictionaries
+        """
+        if self.listing == "api":
+            try:
+                if self.driver:
+                    self.harvest_auth()
+                return self.list_songs_api(filter_criteria)
+            except Exception as e:
+                logger.warning(
+                    f"API listing failed ({str(e)}), falling back to browser"
+                )
+
+        self._ensure_browser()
+        self.navigate_to_library()
+        self.scroll_to_load_all_songs()
+        return self.extract_songs_data(filter_criteria)
+
+    def iter_library_browser(self) -> Iterator[List[Dict]]:
+        """
+        Scroll the library page, extracting songs as each scroll loads them
+
+        Yields:
+            Lists of song dictionaries: the initially rendered songs, then
+            the songs added by each scroll. Consecutive batches may overlap.
+        """
+        self._ensure_browser()
+        self.navigate_to_library()
+
+        offset = 0
+        for count in self._scroll_library():
+            batch = self.extract_songs_data(offset=offset)
+            offset = count
+            yield batch
+
+        # Anything that arrived after the last observed growth
+        yield self.extract_songs_data(offset=offset)
+
+    def iter_library(self) -> Iterator[List[Dict]]:
+        """
+        Stream the library in batches with the configured listing mode
+
+        API listing falls back to scrolling the page if the feed fails; songs
+        seen before the failure may then be yielded again.
+
+        Yields:
+            Lists of song dictionaries (may contain duplicates across batches)
+        """
+        if self.listing == "api":
+            try:
+                if self.driver:
+                    self.harvest_auth()
+                yield from self.iter_library_api()
+                return
+            except Exception as e:
+                logger.warning(
+                    f"API listing failed ({str(e)}), falling back to browser"
+                )
+
+        yield from self.iter_library_browser()
+
+    def _apply_filters(self, songs: List[Dict], criteria: Dict) -> List[Dict]:
+        """Apply filter criteria to songs list"""
+        filtered = songs
+
+        # Filter by title
+        if criteria.get("title"):
+            title_filter = criteria["title"].lower()
+            filtered = [s for s in filtered if title_filter in s["title"].lower()]
+            logger.info(
+                f"Filtered by title '{criteria['title']}': {len(filtered)} songs"
+            )
+
+        # Filter by date range
+        if criteria.get("min_date"):
+            min_date = datetime.fromisoformat(criteria["min_date"])
+            filtered = [
+                s
+                for s in filtered
+                if s.get("created_at")
+                and datetime.fromisoformat(s["created_at"].replace("Z", "+00:00"))
+                >= min_date
+            ]
+            logger.info(f"Filtered by min_date: {len(filtered)} songs")
+
+        if criteria.get("max_date"):
+            max_date = datetime.fromisoformat(criteria["max_date"])
+            filtered = [
+                s
+                for s in filtered
+                if s.get("created_at")
+                and datetime.fromisoformat(s["created_at"].replace("Z", "+00:00"))
+                <= max_date
+            ]
+            logger.info(f"Filtered by max_date: {len(filtered)} songs")
+
+        # Filter by has_video
+        if criteria.get("has_video") is not None:
+            if criteria["has_video"]:
+                filtered = [s for s in filtered if s.get("video_url")]
+            else:
+                filtered = [s for s in filtered if not s.get("video_url")]
+            logger.info(f"Filtered by has_video: {len(filtered)} songs")
 
         # Filter by has_audio
         if criteria.get("has_audio") is not None:
@@ -385,13 +1604,16 @@ class SunoDownloader:
 
         return filtered
 
-    def wait_for_generation(self, song: Dict, max_wait_time: int = 300) -> Dict:
+    def wait_for_generation(
+        self, song: Dict, max_wait_time: Optional[float] = None
+    ) -> Dict:
         """
         Wait for a song to finish generating (for WAV and video)
 
         Args:
             song: Song dictionary
-            max_wait_time: Maximum time to wait in seconds
+            max_wait_time: Maximum time to wait in seconds (default: the
+                downloader's max_wait_time)
 
         Returns:
             Updated song dictionary
@@ -407,37 +1629,59 @@ class SunoDownloader:
             logger.info(f"Song already complete: {song['title']}")
             return song
 
-        start_time = time.time()
-        check_interval = 10  # Check every 10 seconds
-
-        while time.time() - start_time < max_wait_time:
-            logger.info(
-                f"Waiting for generation... ({int(time.time() - start_time)}s elapsed)"
-            )
-            time.sleep(check_interval)
+        released: List[Dict] = []
+        tracker = self._generation_tracker(max_wait_time)
+        tracker.add(song)
+        tracker.run(released.append)
+        return released[0]
+
+    def _generation_tracker(
+        self, max_wait_time: Optional[float] = None
+    ) -> GenerationTracker:
+        """Create a tracker that polls clip status through this downloader"""
+        return GenerationTracker(
+            self._poll_generation,
+            max_wait_time=(
+                self.max_wait_time if max_wait_time is None else max_wait_time
+            ),
+        )
 
-            # Refresh page to get updated data
-            self.driver.refresh()
-            time.sleep(3)
+    def _poll_generation(self, song_ids: Set[str]) -> Dict[str, Dict]:
+        """
+        Fetch the current state of several clips with a single request
 
-            # Re-extract songs data
-            songs = self.extract_songs_data()
+        Uses the first feed page when listing through the API (new clips are
+        listed first), otherwise one refresh of the library page.
 
-            # Find our song
-            updated_song = next((s for s in songs if s["id"] == song_id), None)
+        Args:
+            song_ids: Clip IDs still generating
 
-            if updated_song:
-                status = updated_song.get("status", "").lower()
-                if status == "complete":
-                    logger.info(f"Generation complete for: {updated_song['title']}")
-                    return updated_song
-                else:
-                    logger.info(f"Status: {status}")
+        Returns:
+            Song dictionaries found for those IDs, keyed by ID
+        """
+        if self.listing == "api":
+            try:
+                songs, _ = self._fetch_feed_page(0)
+                return {s["id"]: s for s in songs if s["id"] in song_ids}
+            except Exception as e:
+                logger.warning(
+                    f"Feed status check failed ({str(e)}), refreshing the page instead"
+                )
+
+        if not self.driver and self._session_cookies is not None:
+            self._ensure_browser()
+            self.navigate_to_library()
+        else:
+            # Refresh page to get updated data
+            self.driver.refresh()
+        self._wait_for_network_idle("generation")
 
-        logger.warning(f"Generation timeout for song: {song['title']}")
-        return song
+        songs = self.extract_songs_data()
+        return {s["id"]: s for s in songs if s["id"] in song_ids}
 
-    def download_file(self, url: str, filename: str, file_type: str) -> bool:
+    def download_file(
+        self, url: str, filename: str, file_type: str, clip_id: Optional[str] = None
+    ) -> bool:
         """
         Download a file from URL
 
@@ -445,34 +1689,33 @@ class SunoDownloader:
             url: Download URL
             filename: Filename to save as
             file_type: Type of file (mp3, mp4, wav)
+            clip_id: Suno clip ID; when given the manifest decides skips and
+                records the completed file
 
         Returns:
             True if successful, False otherwise
         """
-        if not url:
-            logger.warning(f"No URL provided for {filename}")
-            return False
-
         filepath = self.download_dir / filename
 
-        # Skip if already exists
-        if filepath.exists():
-            logger.info(f"File already exists, skipping: {filename}")
-            return True
+        skipped = self._skip_download(url, filepath, file_type, clip_id)
+        if skipped is not None:
+            return skipped
+
+        partial = PartialDownload(filepath)
 
         try:
             logger.info(f"Downloading {file_type.upper()}: {filename}")
 
-            response = requests.get(url, stream=True, timeout=30)
-            response.raise_for_status()
+            response = self._open_resumable(partial, url)
 
-            total_size = int(response.headers.get("content-length", 0))
-            downloaded = 0
+            total_size = partial.journal.get("total_size") or 0
+            downloaded = partial.offset
 
-            with open(filepath, "wb") as f:
+            with partial.open() as f:
                 for chunk in response.iter_content(chunk_size=8192):
                     if chunk:
                         f.write(chunk)
+                        partial.hasher.update(chunk)
                         downloaded += len(chunk)
 
                         # Log progress for large files
@@ -482,16 +1725,178 @@ class SunoDownloader:
                             progress = (downloaded / total_size) * 100
                             logger.info(f"Progress: {progress:.1f}%")
 
+            partial.commit()
+            if clip_id:
+                self.manifest.record(
+                    clip_id, file_type, filename, url, partial.checksum
+                )
+            logger.info(f"Successfully downloaded: {filename}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to download {filename}: {str(e)}")
+            # Keep a resumable partial file, clean up anything else
+            partial.abort()
+            return False
+
+    def _open_resumable(self, partial: PartialDownload, url: str):
+        """
+        Issue the GET for a download, resuming from a partial file when possible
+
+        Args:
+            partial: Journal for the destination file
+            url: Download URL
+
+        Returns:
+            Streaming response whose body should be written to ``partial``
+        """
+        while True:
+            response = self.session.get(
+                url, stream=True, timeout=30, headers=partial.request_headers(url)
+            )
+            if not (partial.offset and response.status_code == 416):
+                response.raise_for_status()
+            if partial.accept(url, response.status_code, response.headers):
+                return response
+            response.close()
+
+    def _skip_download(
+        self,
+        url: str,
+        filepath: Path,
+        file_type: str,
+        clip_id: Optional[str] = None,
+    ) -> Optional[bool]:
+        """
+        Decide downloads that need no transfer
+
+        Args:
+            url: Download URL
+            filepath: Destination path
+            file_type: Type of file (mp3, mp4, wav)
+            clip_id: Suno clip ID, if the download is tracked in the manifest
+
+        Returns:
+            False if there is no URL, True if the file is already complete,
+            None if the file should be downloaded
+        """
+        if not url:
+            logger.warning(f"No URL provided for {filepath.name}")
+            return False
+
+        if clip_id and self.manifest.get(clip_id, file_type):
+            if self.manifest.is_complete(clip_id, file_type, url):
+                logger.info(f"Already downloaded, skipping: {filepath.name}")
+                return True
+            # Recorded before but changed remotely or damaged locally
+            logger.info(f"Manifest entry outdated, re-downloading: {filepath.name}")
+            return None
+
+        # Skip if already exists
+        if filepath.exists():
+            logger.info(f"File already exists, skipping: {filepath.name}")
+            if clip_id:
+                # Adopt files downloaded before the manifest existed
+                self.manifest.record(clip_id, file_type, filepath.name, url)
+            return True
+
+        return None
+
+    async def download_file_async(
+        self,
+        session,
+        url: str,
+        filename: str,
+        file_type: str,
+        clip_id: Optional[str] = None,
+    ) -> bool:
+        """
+        Download a file from URL on the asyncio event loop
+
+        Args:
+            session: aiohttp.ClientSession shared by all transfers
+            url: Download URL
+            filename: Filename to save as
+            file_type: Type of file (mp3, mp4, wav)
+            clip_id: Suno clip ID for manifest tracking
+
+        Returns:
+            True if successful, False otherwise
+        """
+        filepath = self.download_dir / filename
+
+        skipped = self._skip_download(url, filepath, file_type, clip_id)
+        if skipped is not None:
+            return skipped
+
+        partial = PartialDownload(filepath)
+
+        try:
+            logger.info(f"Downloading {file_type.upper()}: {filename}")
+
+            while True:
+                async with session.get(
+                    url, headers=partial.request_headers(url)
+                ) as response:
+                    if not (partial.offset and response.status == 416):
+                        response.raise_for_status()
+                    if not partial.accept(url, response.status, response.headers):
+                        continue
+
+                    with partial.open() as f:
+                        async for chunk in response.content.iter_chunked(65536):
+                            f.write(chunk)
+                            partial.hasher.update(chunk)
+                    break
+
+            partial.commit()
+            if clip_id:
+                self.manifest.record(
+                    clip_id, file_type, filename, url, partial.checksum
+                )
             logger.info(f"Successfully downloaded: {filename}")
             return True
 
         except Exception as e:
             logger.error(f"Failed to download {filename}: {str(e)}")
-            # Clean up partial file
-            if filepath.exists():
-                filepath.unlink()
+            # Keep a resumable partial file, clean up anything else
+            partial.abort()
             return False
 
+    async def _download_jobs_async(
+        self, jobs: List[Tuple[str, str, str, str]]
+    ) -> List[bool]:
+        """
+        Run (song_id, file_type, url, filename) jobs concurrently on one event loop
+
+        Args:
+            jobs: Download jobs
+
+        Returns:
+            Success flag per job, in job order
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(
+                "The async engine requires aiohttp (pip install aiohttp)"
+            ) from None
+
+        connector = aiohttp.TCPConnector(
+            limit=self.workers, limit_per_host=self.per_host_limit
+        )
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=30)
+
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout
+        ) as session:
+            return await asyncio.gather(
+                *(
+                    self.download_file_async(session, url, filename, file_type, song_id)
+                    for song_id, file_type, url, filename in jobs
+                )
+            )
+
     def get_wav_url(self, song: Dict) -> Optional[str]:
         """
         Try to get WAV URL for a song (might need API call or special logic)
@@ -524,98 +1929,398 @@ class SunoDownloader:
         logger.info(f"Processing song: {song['title']}")
         logger.info(f"{'='*60}")
 
-        results = {}
-
         # Wait for generation if needed
         if wait_for_gen and song.get("status", "").lower() != "complete":
             song = self.wait_for_generation(song)
 
+        results = {}
+        for file_type, url, filename in self._song_jobs(song):
+            results[file_type] = self.download_file(
+                url, filename, file_type, song["id"]
+            )
+
+        return results
+
+    def _song_jobs(self, song: Dict) -> List[Tuple[str, str, str]]:
+        """
+        Build the (file_type, url, filename) download jobs for a song
+
+        Args:
+            song: Song dictionary
+
+        Returns:
+            One job per requested format, in mp3, mp4, wav order. Filenames are
+            claimed in the manifest so songs sharing a title get distinct files.
+        """
         # Sanitize filename
         safe_title = "".join(
             c for c in song["title"] if c.isalnum() or c in (" ", "-", "_")
         ).strip()
         safe_title = safe_title or song["id"]
 
-        # Download MP3
+        jobs = []
+
         if "mp3" in self.formats:
-            filename = f"{safe_title}.mp3"
-            results["mp3"] = self.download_file(
-                song.get("audio_url", ""), filename, "mp3"
-            )
+            jobs.append(("mp3", song.get("audio_url", ""), f"{safe_title}.mp3"))
 
-        # Download MP4
         if "mp4" in self.formats:
-            filename = f"{safe_title}.mp4"
-            results["mp4"] = self.download_file(
-                song.get("video_url", ""), filename, "mp4"
-            )
+            jobs.append(("mp4", song.get("video_url", ""), f"{safe_title}.mp4"))
 
-        # Download WAV
         if "wav" in self.formats:
-            filename = f"{safe_title}.wav"
-            wav_url = self.get_wav_url(song)
-            results["wav"] = self.download_file(wav_url, filename, "wav")
+            jobs.append(("wav", self.get_wav_url(song), f"{safe_title}.wav"))
+
+        return [
+            (file_type, url, self.manifest.claim(song["id"], file_type, filename))
+            for file_type, url, filename in jobs
+        ]
+
+    def _select_songs(self, songs: List[Dict], since_last_run: bool) -> List[Dict]:
+        """
+        Drop songs the manifest already has in every requested format
+
+        Args:
+            songs: Extracted songs
+            since_last_run: Also drop songs created before the previous run
+                started, except those that failed in it
+
+        Returns:
+            Songs that still need downloading
+        """
+        last_run = self.manifest.last_run()
+        if since_last_run and last_run:
+            since = _parse_timestamp(last_run["started_at"])
+            retry_ids = set(last_run.get("failed_ids", []))
+            songs = [
+                s
+                for s in songs
+                if s["id"] in retry_ids
+                or not s.get("created_at")
+                or _parse_timestamp(s["created_at"]) >= since
+            ]
+            logger.info(
+                f"Songs new since last run ({last_run['started_at']}): {len(songs)}"
+            )
+
+        pending = [
+            s
+            for s in songs
+            if not all(
+                url and self.manifest.is_complete(s["id"], file_type, url)
+                for file_type, url, _ in self._song_jobs(s)
+            )
+        ]
+
+        if len(pending) < len(songs):
+            logger.info(f"Already downloaded: {len(songs) - len(pending)} songs")
+        return pending
+
+    def _download_serially(
+        self, songs: List[Dict], wait_for_generation: bool
+    ) -> Dict[str, Dict[str, bool]]:
+        """
+        Download songs one at a time on the calling thread
+
+        Args:
+            songs: Songs to download
+            wait_for_generation: Wait for songs to finish generating
+
+        Returns:
+            Per-song, per-format download status (empty for songs that errored)
+        """
+        results = {}
+        tracker = self._generation_tracker()
+
+        def download(song: Dict):
+            try:
+                results[song["id"]] = self.download_song(song, wait_for_gen=False)
+            except Exception as e:
+                logger.error(f"Error processing song {song['title']}: {str(e)}")
+                results[song["id"]] = {}
+
+        for i, song in enumerate(songs, 1):
+            logger.info(f"\nProcessing song {i}/{len(songs)}")
+
+            # Songs still generating are polled together once the rest are done
+            if wait_for_generation and song.get("status", "").lower() != "complete":
+                tracker.add(song)
+                continue
+            download(song)
+
+        if tracker.pending:
+            tracker.run(download)
 
         return results
 
-    def run(
-        self, filter_criteria: Optional[Dict] = None, wait_for_generation: bool = True
-    ):
+    def _queue_songs(
+        self,
+        songs: List[Dict],
+        wait_for_generation: bool,
+        submit: Callable[[str, str, str, str], None],
+    ) -> Dict[str, Dict[str, bool]]:
         """
-        Main execution method
+        Hand each song's jobs to ``submit``, waiting for generation where needed
+
+        Complete songs are submitted straight away. Songs still generating
+        are then polled together by a GenerationTracker on this thread
+        (status checks may drive the browser) and submitted as each one
+        completes.
 
         Args:
-            filter_criteria: Dictionary with filter options
+            songs: Songs to download
             wait_for_generation: Wait for songs to finish generating
+            submit: Callable taking (song_id, file_type, url, filename)
+
+        Returns:
+            Per-song results with an empty entry for every song
         """
-        try:
-            # Setup browser
-            self.setup_driver()
+        results: Dict[str, Dict[str, bool]] = {}
+        tracker = self._generation_tracker()
+
+        def queue(song: Dict):
+            try:
+                for file_type, url, filename in self._song_jobs(song):
+                    submit(song["id"], file_type, url, filename)
+            except Exception as e:
+                logger.error(f"Error processing song {song['title']}: {str(e)}")
+
+        for i, song in enumerate(songs, 1):
+            logger.info(f"Queueing song {i}/{len(songs)}: {song['title']}")
+            results[song["id"]] = {}
+
+            if wait_for_generation and song.get("status", "").lower() != "complete":
+                tracker.add(song)
+            else:
+                queue(song)
 
-            # Login
-            if not self.login():
-                logger.error("Login failed, aborting...")
-                return
+        if tracker.pending:
+            tracker.run(queue)
 
-            # Navigate to library
-            self.navigate_to_library()
+        return results
 
-            # Load all songs
-            self.scroll_to_load_all_songs()
+    def _download_async(
+        self, songs: List[Dict], wait_for_generation: bool
+    ) -> Dict[str, Dict[str, bool]]:
+        """
+        Download songs with the asyncio engine
 
-            # Extract songs
-            songs = self.extract_songs_data(filter_criteria)
+        All jobs are queued first; the transfers then run on a single event
+        loop, at most ``workers`` at a time.
 
-            if not songs:
-                logger.warning("No songs found matching criteria")
-                return
+        Args:
+            songs: Songs to download
+            wait_for_generation: Wait for songs to finish generating
 
-            logger.info(f"\n{'='*60}")
-            logger.info(f"Found {len(songs)} songs to download")
-            logger.info(f"{'='*60}\n")
+        Returns:
+            Per-song, per-format download status
+        """
+        jobs: List[Tuple[str, str, str, str]] = []
+        results = self._queue_songs(
+            songs, wait_for_generation, lambda *job: jobs.append(job)
+        )
 
-            # Download each song
-            success_count = 0
-            fail_count = 0
+        outcomes = asyncio.run(self._download_jobs_async(jobs))
+        for (song_id, file_type, _, _), success in zip(jobs, outcomes):
+            results[song_id][file_type] = success
 
-            for i, song in enumerate(songs, 1):
-                logger.info(f"\nProcessing song {i}/{len(songs)}")
+        return results
 
-                try:
-                    results = self.download_song(song, wait_for_gen=wait_for_generation)
+    def _download_concurrently(
+        self, songs: List[Dict], wait_for_generation: bool
+    ) -> Dict[str, Dict[str, bool]]:
+        """
+        Download songs through a DownloadEngine worker pool
+
+        Args:
+            songs: Songs to download
+            wait_for_generation: Wait for songs to finish generating
+
+        Returns:
+            Per-song, per-format download status
+        """
+        engine = DownloadEngine(
+            self.download_file,
+            workers=self.workers,
+            per_host_limit=self.per_host_limit,
+        )
+        engine.start()
+
+        results = self._queue_songs(songs, wait_for_generation, engine.submit)
+        for song_id, formats in engine.join().items():
+            results[song_id].update(formats)
+
+        return results
+
+    def _download_pipelined(
+        self,
+        filter_criteria: Optional[Dict],
+        since_last_run: bool,
+        wait_for_generation: bool,
+    ) -> Dict[str, Dict[str, bool]]:
+        """
+        Download songs while the library is still being listed
+
+        Each batch from iter_library is de-duplicated by clip ID, filtered
+        and handed straight to a DownloadEngine. Songs that still need to
+        finish generating are deferred until listing is done, since waiting
+        on them drives the same browser that is scrolling the library.
+
+        Args:
+            filter_criteria: Dictionary with filter options
+            since_last_run: Only consider songs created since the previous run
+            wait_for_generation: Wait for songs to finish generating
 
-                    if any(results.values()):
-                        success_count += 1
+        Returns:
+            Per-song, per-format download status
+        """
+        engine = DownloadEngine(
+            self.download_file,
+            workers=self.workers,
+            per_host_limit=self.per_host_limit,
+        )
+        engine.start()
+
+        seen: set = set()
+        deferred: List[Dict] = []
+        results: Dict[str, Dict[str, bool]] = {}
+
+        with self.timings.phase("listing"):
+            for batch in self.iter_library():
+                fresh = [s for s in batch if s["id"] not in seen]
+                seen.update(s["id"] for s in fresh)
+                if filter_criteria:
+                    fresh = self._apply_filters(fresh, filter_criteria)
+                fresh = self._select_songs(fresh, since_last_run)
+
+                ready = []
+                for song in fresh:
+                    if (
+                        wait_for_generation
+                        and song.get("status", "").lower() != "complete"
+                    ):
+                        deferred.append(song)
                     else:
-                        fail_count += 1
+                        ready.append(song)
+                results.update(self._queue_songs(ready, False, engine.submit))
+
+        logger.info(
+            f"Listed {len(seen)} songs; {len(results)} queued while listing, "
+            f"{len(deferred)} waiting for generation"
+        )
+        results.update(self._queue_songs(deferred, True, engine.submit))
+
+        for song_id, formats in engine.join().items():
+            results[song_id].update(formats)
+
+        if engine.first_file_at is not None:
+            logger.info(
+                f"First file finished {engine.first_file_at - engine.started_at:.1f}s "
+                f"after listing started"
+            )
+        return results
+
+    def _list_and_download(
+        self,
+        filter_criteria: Optional[Dict],
+        since_last_run: bool,
+        wait_for_generation: bool,
+    ) -> Optional[Dict[str, Dict[str, bool]]]:
+        """
+        List the whole library, then download the selected songs
+
+        Args:
+            filter_criteria: Dictionary with filter options
+            since_last_run: Only consider songs created since the previous run
+            wait_for_generation: Wait for songs to finish generating
+
+        Returns:
+            Per-song, per-format download status, or None if nothing matched
+        """
+        # List songs (feed API or scrolling the library page)
+        with self.timings.phase("listing"):
+            songs = self.list_songs(filter_criteria)
+
+        if not songs:
+            logger.warning("No songs found matching criteria")
+            return None
+
+        songs = self._select_songs(songs, since_last_run)
+
+        logger.info(f"\n{'='*60}")
+        logger.info(f"Found {len(songs)} songs to download")
+        logger.info(f"{'='*60}\n")
+
+        # Download each song
+        with self.timings.phase("downloads"):
+            if self.engine == "async":
+                results = self._download_async(songs, wait_for_generation)
+            elif self.workers > 1:
+                results = self._download_concurrently(songs, wait_for_generation)
+            else:
+                results = self._download_serially(songs, wait_for_generation)
+
+        return results
+
+    def run(
+        self,
+        filter_criteria: Optional[Dict] = None,
+        wait_for_generation: bool = True,
+        since_last_run: bool = False,
+    ):
+        """
+        Main execution method
 
-                except Exception as e:
-                    logger.error(f"Error processing song {song['title']}: {str(e)}")
-                    fail_count += 1
+        Args:
+            filter_criteria: Dictionary with filter options
+            wait_for_generation: Wait for songs to finish generating
+            since_last_run: Only consider songs created since the previous run
+                recorded in the manifest (plus that run's failures)
+        """
+        started_at = datetime.now(timezone.utc).isoformat()
+
+        try:
+            # Reuse a cached session, otherwise setup browser and login
+            with self.timings.phase("login"):
+                logged_in = self.restore_session()
+                if not logged_in:
+                    self.setup_driver()
+                    logged_in = self.login()
+
+                    if logged_in and self.session_cache:
+                        try:
+                            self.session_cache.save(self.driver.get_cookies())
+                        except (OSError, TypeError, ValueError) as e:
+                            logger.warning(f"Could not cache session: {e}")
+
+            if not logged_in:
+                logger.error("Login failed, aborting...")
+                return
+
+            if self.pipeline:
+                # List and download at the same time
+                with self.timings.phase("pipeline"):
+                    results = self._download_pipelined(
+                        filter_criteria, since_last_run, wait_for_generation
+                    )
+            else:
+                results = self._list_and_download(
+                    filter_criteria, since_last_run, wait_for_generation
+                )
+                if results is None:
+                    return
+
+            self.manifest.record_run(started_at, results)
+            self.manifest.compact()
+
+            success_count = sum(1 for r in results.values() if any(r.values()))
+            fail_count = len(results) - success_count
 
             logger.info(f"\n{'='*60}")
             logger.info(f"Download complete!")
             logger.info(f"Success: {success_count}, Failed: {fail_count}")
+            stats = connection_stats(self.session)
+            logger.info(
+                f"Connections opened: {stats['opened']}, reused: {stats['reused']}"
+            )
             logger.info(f"{'='*60}\n")
 
         except Exception as e:
@@ -623,6 +2328,10 @@ class SunoDownloader:
             raise
 
         finally:
+            logger.info("Phase timings:")
+            for line in self.timings.report():
+                logger.info(f"  {line}")
+            self.session.close()
             if self.driver:
                 logger.info("Closing browser...")
                 self.driver.quit()
@@ -655,6 +2364,12 @@ Examples:
 
   # Don't wait for generation (skip incomplete songs)
   python automated_downloader.py -u user@example.com -p password --no-wait
+
+  # Download with 8 concurrent workers
+  python automated_downloader.py -u user@example.com -p password --workers 8
+
+  # Run hundreds of transfers on a single asyncio event loop
+  python automated_downloader.py -c config.json --engine async --workers 200
         """,
     )
 
@@ -688,6 +2403,72 @@ Examples:
         action="store_true",
         help="Don't wait for song generation to complete",
     )
+    parser.add_argument(
+        "--max-wait-time",
+        type=float,
+        help="Maximum seconds to wait for songs to finish generating (default: 300)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of concurrent download workers (default: 4, 1 = serial)",
+    )
+    parser.add_argument(
+        "--per-host-limit",
+        type=int,
+        help="Maximum concurrent downloads per host (default: 4)",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Start downloading while the library is still being listed",
+    )
+    parser.add_argument(
+        "--since-last-run",
+        action="store_true",
+        help="Only download songs created since the previous run (from the manifest)",
+    )
+    parser.add_argument(
+        "--session-cache",
+        help="Cookie cache used to skip the browser login on repeat runs "
+        "(default: ~/.cache/suno-ai/session.json)",
+    )
+    parser.add_argument(
+        "--no-session-cache",
+        action="store_true",
+        help="Always log in through the browser and don't cache the session",
+    )
+    parser.add_argument(
+        "--timeout",
+        action="append",
+        default=[],
+        metavar="NAME=SECONDS",
+        help="Upper bound for a page wait: element, login, scroll or idle "
+        "(repeatable, e.g. --timeout scroll=5)",
+    )
+    parser.add_argument(
+        "--max-scroll-attempts",
+        type=int,
+        help="Stop scrolling the library after N scrolls "
+        "(default: scroll until the clip count stops growing)",
+    )
+    parser.add_argument(
+        "--listing",
+        choices=["browser", "api"],
+        help="How to list the library: browser (scroll the page) or api "
+        "(page through the library feed over HTTP) (default: browser)",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["threads", "async"],
+        help="Download engine: threads (worker pool) or async (asyncio, "
+        "suits hundreds of workers) (default: threads)",
+    )
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        help="Keep-alive HTTP connections kept open per host (default: 10)",
+    )
 
     # Filter arguments
     parser.add_argument("--filter-title", help="Filter songs by title (contains)")
@@ -744,10 +2525,52 @@ Examples:
     wait_for_gen = (
         download_config.get("wait_for_generation", True) if not args.no_wait else False
     )
+    max_wait_time = (
+        args.max_wait_time
+        if args.max_wait_time is not None
+        else download_config.get("max_wait_time", 300)
+    )
+    workers = (
+        args.workers if args.workers is not None else download_config.get("workers", 4)
+    )
+    per_host_limit = (
+        args.per_host_limit
+        if args.per_host_limit is not None
+        else download_config.get("per_host_limit", 4)
+    )
+    pool_size = (
+        args.pool_size
+        if args.pool_size is not None
+        else download_config.get("pool_size", 10)
+    )
+    engine = args.engine or download_config.get("engine", "threads")
+    listing = args.listing or download_config.get("listing", "browser")
+    pipeline = args.pipeline or download_config.get("pipeline", False)
 
     # Get browser settings
     browser_config = config.get("browser", {})
     headless = args.headless or browser_config.get("headless", False)
+    session_cache = (
+        None
+        if args.no_session_cache
+        else args.session_cache
+        or browser_config.get("session_cache", "~/.cache/suno-ai/session.json")
+    )
+    max_scroll_attempts = args.max_scroll_attempts or browser_config.get(
+        "max_scroll_attempts"
+    )
+    timeouts = dict(browser_config.get("timeouts", {}))
+    for value in args.timeout:
+        name, _, seconds = value.partition("=")
+        if name not in SunoDownloader.DEFAULT_TIMEOUTS:
+            parser.error(
+                f"Unknown timeout '{name}' (choose from "
+                f"{', '.join(SunoDownloader.DEFAULT_TIMEOUTS)})"
+            )
+        try:
+            timeouts[name] = float(seconds)
+        except ValueError:
+            parser.error(f"Invalid timeout value: {value}")
 
     # Build filter criteria (command line overrides config)
     config_filters = config.get("filters", {})
@@ -773,11 +2596,22 @@ Examples:
         download_dir=output_dir,
         headless=headless,
         formats=formats,
+        workers=workers,
+        per_host_limit=per_host_limit,
+        pool_size=pool_size,
+        engine=engine,
+        listing=listing,
+        session_cache=session_cache,
+        timeouts=timeouts,
+        max_scroll_attempts=max_scroll_attempts,
+        pipeline=pipeline,
+        max_wait_time=max_wait_time,
     )
 
     downloader.run(
         filter_criteria=filter_criteria if filter_criteria else None,
         wait_for_generation=wait_for_gen,
+        since_last_run=args.since_last_run,
     )
 
 
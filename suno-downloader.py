@@ -1,10 +1,29 @@
 # Usage: python suno-downloader.py <path-to-js-output-file>
 import requests
+from requests.adapters import HTTPAdapter
 import os
 import sys
 
-def download_file(url, filename):
-    response = requests.get(url, stream=True)
+def create_session(pool_size=10):
+    """Create a keep-alive session so every download reuses pooled connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def connection_stats(session):
+    """Return (opened, reused) connection counts for the session's pools."""
+    opened = requests_made = 0
+    for adapter in set(session.adapters.values()):
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            opened += pools[key].num_connections
+            requests_made += pools[key].num_requests
+    return opened, max(0, requests_made - opened)
+
+def download_file(session, url, filename):
+    response = session.get(url, stream=True, timeout=30)
     response.raise_for_status()
     with open(filename, 'wb') as file:
         for chunk in response.iter_content(chunk_size=8192):
@@ -23,6 +42,7 @@ def main():
     if not os.path.exists('downloads'):
         os.makedirs('downloads')
 
+    session = create_session()
     names = ()
     # Process each file entry
     for entry in file_entries:
@@ -44,12 +64,15 @@ def main():
 
 
 
-            download_file(url, os.path.join('downloads', filename))
+            download_file(session, url, os.path.join('downloads', filename))
             print(f"Successfully downloaded: {filename}")
         except Exception as e:
             print(f"Failed to download {entry}. Error: {str(e)}")
 
+    opened, reused = connection_stats(session)
+    session.close()
     print("Download process completed.")
+    print(f"Connections opened: {opened}, reused: {reused}")
 
 if __name__ == "__main__":
     main()
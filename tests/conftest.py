@@ -4,8 +4,10 @@ Pytest configuration and shared fixtures
 
 import os
 import sys
+import threading
 import pytest
 import tempfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -13,6 +15,14 @@ from unittest.mock import MagicMock
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Run each test from a scratch directory and home so default paths stay isolated"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+
+
 @pytest.fixture
 def temp_download_dir():
     """Create a temporary download directory"""
@@ -102,3 +112,75 @@ def sample_config():
             "max_date": ""
         }
     }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Keep-alive HTTP handler serving the files registered on the server"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requests.append(("GET", self.path, dict(self.headers)))
+        body = self.server.files.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        etag = self.server.etags.get(self.path)
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        start = 0
+
+        if self.server.accept_ranges and range_header and if_range in (None, etag):
+            start = int(range_header.split("=")[1].split("-")[0])
+            if start >= len(body):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(body)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        else:
+            self.send_response(200)
+
+        if self.server.accept_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+
+        # Simulate a dropped connection after ``truncate[path]`` bytes
+        cut = self.server.truncate.pop(self.path, None)
+        if cut is not None:
+            self.wfile.write(body[start:start + cut])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+
+        self.wfile.write(body[start:])
+
+
+@pytest.fixture
+def http_server():
+    """Local HTTP/1.1 server; register content in ``server.files[path]``"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    server.files = {}
+    server.etags = {}
+    server.truncate = {}
+    server.accept_ranges = True
+    server.requests = []
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
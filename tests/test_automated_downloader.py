@@ -6,6 +6,7 @@ Covers all classes, methods, and edge cases
 import os
 import sys
 import json
+import hashlib
 import tempfile
 import pytest
 from pathlib import Path
@@ -15,7 +16,17 @@ from datetime import datetime
 # Add parent directory to path to import the module
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from automated_downloader import SunoDownloader
+from automated_downloader import (
+    DownloadEngine,
+    DownloadManifest,
+    PartialDownload,
+    PhaseTimer,
+    SessionCache,
+    SunoDownloader,
+    clip_to_song,
+    connection_stats,
+    create_http_session,
+)
 
 
 class TestSunoDownloaderInit:
@@ -264,6 +275,139 @@ class TestLogin:
             downloader.login()
 
 
+class TestSessionCache:
+    """Test the cached login session"""
+
+    COOKIES = [
+        {'name': '__session', 'value': 'jwt-token', 'domain': '.suno.com', 'path': '/',
+         'expiry': 4102444800},
+        {'name': 'expired', 'value': 'x', 'domain': '.suno.com', 'expiry': 1},
+        {'name': 'session-only', 'value': 'y', 'domain': '.suno.com'},
+    ]
+
+    def test_save_and_load(self, tmp_path):
+        """Test round trip, owner-only permissions and expiry filtering"""
+        cache = SessionCache(str(tmp_path / 'cache' / 'session.json'), 'user@test.com')
+        cache.save(self.COOKIES)
+
+        assert [c['name'] for c in cache.load()] == ['__session', 'session-only']
+        if os.name == 'posix':
+            assert (tmp_path / 'cache' / 'session.json').stat().st_mode & 0o777 == 0o600
+        assert SessionCache(str(tmp_path / 'cache' / 'session.json'), 'other@test.com').load() is None
+
+    def test_load_missing_or_expired(self, tmp_path):
+        """Test that absent, corrupt or fully expired caches are unusable"""
+        cache = SessionCache(str(tmp_path / 'session.json'), 'user@test.com')
+        assert cache.load() is None
+
+        (tmp_path / 'session.json').write_text('not json')
+        assert cache.load() is None
+
+        cache.save([self.COOKIES[1]])
+        assert cache.load() is None
+
+        cache.clear()
+        cache.clear()
+        assert not (tmp_path / 'session.json').exists()
+
+    def test_restore_session_valid(self, http_server, tmp_path):
+        """Test that a cached session accepted by the feed skips the browser"""
+        http_server.files['/api/feed/v2?page=0'] = b'{"clips": []}'
+        cache_path = str(tmp_path / 'session.json')
+        SessionCache(cache_path, 'user@test.com').save(self.COOKIES)
+
+        downloader = SunoDownloader("user@test.com", "password", download_dir=str(tmp_path),
+                                    session_cache=cache_path)
+        downloader.API_URL = http_server.url
+
+        assert downloader.restore_session() is True
+        assert http_server.requests[0][2]['Authorization'] == 'Bearer jwt-token'
+
+    def test_restore_session_rejected(self, http_server, tmp_path):
+        """Test that a session the feed rejects is cleared"""
+        cache_path = str(tmp_path / 'session.json')
+        SessionCache(cache_path, 'user@test.com').save(self.COOKIES)
+
+        downloader = SunoDownloader("user@test.com", "password", download_dir=str(tmp_path),
+                                    session_cache=cache_path)
+        downloader.API_URL = http_server.url
+
+        assert downloader.restore_session() is False
+        assert not (tmp_path / 'session.json').exists()
+        assert 'Authorization' not in downloader.session.headers
+
+    def test_restore_session_disabled_or_empty(self, tmp_path):
+        """Test restore without a cache or with nothing cached"""
+        downloader = SunoDownloader("user@test.com", "password", download_dir=str(tmp_path))
+        assert downloader.restore_session() is False
+
+        downloader = SunoDownloader("user@test.com", "password", download_dir=str(tmp_path),
+                                    session_cache=str(tmp_path / 'session.json'))
+        assert downloader.restore_session() is False
+
+    def test_validate_session_connection_error(self, tmp_path):
+        """Test that an unreachable feed counts as an invalid session"""
+        downloader = SunoDownloader("user@test.com", "password", download_dir=str(tmp_path))
+
+        with patch.object(downloader.session, 'get', side_effect=Exception("offline")):
+            assert downloader.validate_session() is False
+
+    def test_run_with_cached_session_skips_browser(self, tmp_path):
+        """Test that API listing with a valid cached session never launches Chrome"""
+        downloader = SunoDownloader("user@test.com", "password", download_dir=str(tmp_path),
+                                    listing='api', session_cache=str(tmp_path / 'session.json'))
+
+        with patch.object(downloader, 'restore_session', return_value=True), \
+                patch.object(downloader, 'setup_driver') as mock_setup, \
+                patch.object(downloader, 'list_songs_api', return_value=[]) as mock_list:
+            downloader.run()
+
+        mock_setup.assert_not_called()
+        mock_list.assert_called_once_with(None)
+
+    def test_run_saves_session_after_login(self, tmp_path):
+        """Test that a browser login stores the driver's cookies"""
+        cache_path = str(tmp_path / 'session.json')
+        downloader = SunoDownloader("user@test.com", "password", download_dir=str(tmp_path),
+                                    session_cache=cache_path)
+        mock_driver = MagicMock()
+        mock_driver.get_cookies.return_value = self.COOKIES[:1]
+
+        def setup_driver():
+            downloader.driver = mock_driver
+
+        with patch.object(downloader, 'setup_driver', side_effect=setup_driver), \
+                patch.object(downloader, 'login', return_value=True), \
+                patch.object(downloader, 'list_songs', return_value=[]):
+            downloader.run()
+
+        assert SessionCache(cache_path, 'user@test.com').load() == self.COOKIES[:1]
+
+    def test_browser_launched_on_demand_with_cookies(self, tmp_path):
+        """Test that a restored session opens Chrome with its cookies when needed"""
+        downloader = SunoDownloader("user@test.com", "password", download_dir=str(tmp_path))
+        downloader._session_cookies = self.COOKIES[:2]
+        mock_driver = MagicMock()
+        mock_driver.add_cookie.side_effect = [None, Exception("invalid domain")]
+
+        def setup_driver():
+            downloader.driver = mock_driver
+
+        with patch.object(downloader, 'setup_driver', side_effect=setup_driver), \
+                patch.object(downloader, 'navigate_to_library') as mock_navigate, \
+                patch('automated_downloader.time.sleep'):
+            downloader.wait_for_generation({'id': 'clip1', 'title': 'Song', 'status': 'queued'},
+                                           max_wait_time=0)
+
+        mock_driver.get.assert_called_once_with(SunoDownloader.SUNO_URL)
+        assert mock_driver.add_cookie.call_count == 2
+        assert mock_driver.add_cookie.call_args_list[0][0][0]['name'] == '__session'
+        mock_navigate.assert_called_once()
+
+        downloader._ensure_browser()
+        mock_driver.get.assert_called_once()
+
+
 class TestNavigateToLibrary:
     """Test navigation to songs library"""
 
@@ -311,58 +455,199 @@ class TestNavigateToLibrary:
 class TestScrollToLoadAllSongs:
     """Test scrolling to load all songs"""
 
+    @staticmethod
+    def _driver_with_counts(mock_chrome, counts):
+        """Mock driver whose clip count follows counts, then stays at the last value"""
+        mock_driver = MagicMock()
+        mock_chrome.return_value = mock_driver
+        counts = iter(counts)
+        last = [0]
+
+        def execute_script_handler(script, *args):
+            if 'clipCount' in script:
+                last[0] = next(counts, last[0])
+                return last[0]
+            return None
+
+        mock_driver.execute_script.side_effect = execute_script_handler
+        return mock_driver
+
+    @staticmethod
+    def _scroll_jumps(mock_driver):
+        return [c[0][1] for c in mock_driver.execute_script.call_args_list
+                if 'scrollTop' in c[0][0]]
+
     @patch('automated_downloader.webdriver.Chrome')
     @patch('automated_downloader.time.sleep')
     def test_scroll_until_end(self, mock_sleep, mock_chrome):
-        """Test scrolling until reaching the end"""
+        """Test scrolling until the clip count is stable"""
+        mock_driver = self._driver_with_counts(mock_chrome, [20, 40, 80])
+
+        downloader = SunoDownloader("user@test.com", "password", timeouts={'scroll': 2})
+        downloader.setup_driver()
+
+        downloader.scroll_to_load_all_songs()
+
+        jumps = self._scroll_jumps(mock_driver)
+        # Jumps double while clips arrive, then back to the top
+        assert jumps[:3] == [1, 2, 4]
+        assert jumps[-1] == 0
+        # Waits back off exponentially until stable for the scroll timeout
+        assert len(jumps) - 1 == 2 + 4  # 2 growing scrolls, 0.25+0.5+1+0.25 stable
+        assert downloader.timings.waited['listing'] >= 0
+
+    @patch('automated_downloader.webdriver.Chrome')
+    @patch('automated_downloader.time.sleep')
+    def test_scroll_jump_is_capped(self, mock_sleep, mock_chrome):
+        """Test that the scroll jump stops growing at MAX_SCROLL_JUMP viewports"""
+        mock_driver = self._driver_with_counts(mock_chrome, range(0, 200, 20))
+
+        downloader = SunoDownloader("user@test.com", "password", timeouts={'scroll': 0.25})
+        downloader.setup_driver()
+
+        downloader.scroll_to_load_all_songs()
+
+        assert max(self._scroll_jumps(mock_driver)) == SunoDownloader.MAX_SCROLL_JUMP
+
+    @patch('automated_downloader.webdriver.Chrome')
+    @patch('automated_downloader.time.sleep')
+    def test_scroll_has_no_default_attempt_limit(self, mock_sleep, mock_chrome):
+        """Test that large libraries are not truncated after 20 scrolls"""
+        mock_driver = self._driver_with_counts(mock_chrome, range(0, 2000, 20))
+
+        downloader = SunoDownloader("user@test.com", "password", timeouts={'scroll': 0.25})
+        downloader.setup_driver()
+
+        downloader.scroll_to_load_all_songs()
+
+        assert len(self._scroll_jumps(mock_driver)) > 20
+
+    @patch('automated_downloader.webdriver.Chrome')
+    @patch('automated_downloader.time.sleep')
+    def test_scroll_max_attempts(self, mock_sleep, mock_chrome, caplog):
+        """Test scrolling hitting a configured attempt limit"""
+        mock_driver = self._driver_with_counts(mock_chrome, range(0, 2000, 20))
+
+        downloader = SunoDownloader("user@test.com", "password", max_scroll_attempts=5)
+        downloader.setup_driver()
+
+        with caplog.at_level('WARNING', logger='automated_downloader'):
+            downloader.scroll_to_load_all_songs()
+
+        assert len(self._scroll_jumps(mock_driver)) == 5 + 1
+        assert 'Stopped after 5 scroll attempts' in caplog.text
+
+    @patch('automated_downloader.webdriver.Chrome')
+    def test_clip_count_without_grid(self, mock_chrome):
+        """Test that a missing grid counts as no clips"""
         mock_driver = MagicMock()
         mock_chrome.return_value = mock_driver
+        mock_driver.execute_script.return_value = None
 
-        # Simulate scroll heights: 1000, 2000, 2000 (no change = end)
-        heights = [1000, 2000, 2000]
-        height_index = [0]
+        downloader = SunoDownloader("user@test.com", "password")
+        downloader.setup_driver()
 
-        def get_height(script):
-            if 'scrollHeight' in script:
-                result = heights[height_index[0]]
-                height_index[0] = min(height_index[0] + 1, len(heights) - 1)
-                return result
-            return None
+        assert downloader._clip_count() == 0
+
+
+class TestPageWaits:
+    """Test condition-based page waits and phase timings"""
 
-        mock_driver.execute_script.side_effect = get_height
+    def test_phase_timer_report(self):
+        """Test that phases accumulate elapsed and waited time"""
+        timer = PhaseTimer()
+        with timer.phase('login'):
+            pass
+        with timer.phase('login'):
+            pass
+        timer.add_wait('login', 1.5)
+        timer.add_wait('generation', 0.25)
 
+        report = timer.report()
+
+        assert report[0].startswith('login: ')
+        assert report[0].endswith('(waited 1.50s)')
+        assert report[1] == 'generation: 0.00s (waited 0.25s)'
+
+    def test_timeouts_override_defaults(self):
+        """Test that configured timeouts override only the given waits"""
+        downloader = SunoDownloader("user@test.com", "password", timeouts={'scroll': 2})
+
+        assert downloader.timeouts['scroll'] == 2
+        assert downloader.timeouts['login'] == SunoDownloader.DEFAULT_TIMEOUTS['login']
+
+    @patch('automated_downloader.time.sleep')
+    def test_wait_until_returns_as_soon_as_condition_holds(self, mock_sleep):
+        """Test that a satisfied condition ends the wait without sleeping further"""
         downloader = SunoDownloader("user@test.com", "password")
-        downloader.setup_driver()
+        results = iter([None, False, 'ready'])
 
-        downloader.scroll_to_load_all_songs()
+        assert downloader._wait_until(lambda: next(results), 5, 'login') == 'ready'
+        assert mock_sleep.call_count == 2
+        assert 'login' in downloader.timings.waited
+
+    @patch('automated_downloader.time.sleep')
+    def test_wait_until_is_bounded(self, mock_sleep):
+        """Test that an unmet condition gives up after the timeout"""
+        downloader = SunoDownloader("user@test.com", "password")
+        condition = MagicMock(return_value=False)
 
-        # Should have called execute_script multiple times
-        assert mock_driver.execute_script.call_count >= 3
+        assert downloader._wait_until(condition, 1, 'listing') is None
+        assert condition.call_count <= 1 / SunoDownloader.POLL_INTERVAL + 1
+
+        condition.reset_mock()
+        assert downloader._wait_until(condition, 0, 'listing') is None
+        condition.assert_called_once()
 
     @patch('automated_downloader.webdriver.Chrome')
     @patch('automated_downloader.time.sleep')
-    def test_scroll_max_attempts(self, mock_sleep, mock_chrome):
-        """Test scrolling hitting max attempts"""
+    def test_login_waits_for_url_change(self, mock_sleep, mock_chrome):
+        """Test that login polls the URL until it leaves the login page"""
         mock_driver = MagicMock()
         mock_chrome.return_value = mock_driver
+        urls = iter(["https://suno.com/login", "https://suno.com/login"])
+        type(mock_driver).current_url = property(
+            lambda self: next(urls, "https://suno.com/create"))
+        mock_wait = MagicMock()
 
-        # Simulate page that keeps growing (never reaches end)
-        call_count = [0]
-        def get_increasing_height(script):
-            if 'scrollHeight' in script:
-                call_count[0] += 1
-                return 1000 + call_count[0] * 100  # Always increasing
-            return None
+        downloader = SunoDownloader("user@test.com", "password")
+        downloader.setup_driver()
+        downloader.wait = mock_wait
+
+        assert downloader.login() is True
+        assert mock_sleep.call_count == 2
 
-        mock_driver.execute_script.side_effect = get_increasing_height
+    @patch('automated_downloader.webdriver.Chrome')
+    @patch('automated_downloader.time.sleep')
+    def test_network_idle(self, mock_sleep, mock_chrome):
+        """Test waiting for the page to stop fetching resources"""
+        mock_driver = MagicMock()
+        mock_chrome.return_value = mock_driver
+        mock_driver.execute_script.side_effect = [False, False, True]
 
         downloader = SunoDownloader("user@test.com", "password")
         downloader.setup_driver()
 
-        downloader.scroll_to_load_all_songs()
+        assert downloader._wait_for_network_idle('generation') is True
+        assert 'readyState' in mock_driver.execute_script.call_args[0][0]
+
+        mock_driver.execute_script.side_effect = None
+        mock_driver.execute_script.return_value = False
+        downloader.timeouts['idle'] = 0
+        assert downloader._wait_for_network_idle('generation') is False
+
+    def test_run_logs_phase_timings(self, tmp_path, caplog):
+        """Test that run reports how long each phase took"""
+        downloader = SunoDownloader("user@test.com", "password", download_dir=str(tmp_path))
+
+        with patch.object(downloader, 'restore_session', return_value=True), \
+                patch.object(downloader, 'list_songs', return_value=[]), \
+                caplog.at_level('INFO', logger='automated_downloader'):
+            downloader.run()
 
-        # Should have hit max attempts (20)
-        assert call_count[0] >= 20
+        assert 'Phase timings:' in caplog.text
+        assert 'login: ' in caplog.text
+        assert 'listing: ' in caplog.text
 
 
 class TestExtractSongsData:
@@ -426,6 +711,143 @@ class TestExtractSongsData:
         assert len(songs) == 0
 
 
+class TestApiListing:
+    """Test listing the library through the feed API"""
+
+    def _clip(self, i, **extra):
+        clip = {
+            'id': f'clip{i}',
+            'title': f' Song {i} ',
+            'audio_url': f'https://cdn.example.com/clip{i}.mp3',
+            'video_url': '',
+            'image_url': '',
+            'created_at': '2025-01-01T00:00:00Z',
+            'status': 'complete',
+            'metadata': {'duration': 120.5, 'tags': 'pop, upbeat'},
+        }
+        clip.update(extra)
+        return clip
+
+    def _serve_feed(self, server, pages, total=None):
+        for page, clips in enumerate(pages):
+            body = clips if total is False else {
+                'clips': clips,
+                'num_total_results': total,
+                'current_page': page,
+            }
+            server.files[f'/api/feed/v2?page={page}'] = json.dumps(body).encode()
+
+    def _downloader(self, server, tmpdir, **kwargs):
+        downloader = SunoDownloader("user@test.com", "password", download_dir=tmpdir, **kwargs)
+        downloader.API_URL = server.url
+        return downloader
+
+    def test_clip_to_song_matches_page_shape(self):
+        """Test that feed clips map to the same keys as the page extraction"""
+        song = clip_to_song(self._clip(1))
+
+        assert song == {
+            'id': 'clip1',
+            'title': 'Song 1',
+            'audio_url': 'https://cdn.example.com/clip1.mp3',
+            'video_url': '',
+            'image_url': '',
+            'created_at': '2025-01-01T00:00:00Z',
+            'duration': 120.5,
+            'status': 'complete',
+            'tags': ['pop', 'upbeat'],
+        }
+        assert clip_to_song({'id': 'x', 'title': None, 'tags': ['a']})['title'] == 'x'
+        assert clip_to_song({'id': 'x', 'tags': ['a']})['tags'] == ['a']
+
+    def test_harvest_auth(self, temp_download_dir):
+        """Test that browser cookies and the session token move to the HTTP session"""
+        downloader = SunoDownloader("user@test.com", "password", download_dir=temp_download_dir)
+        downloader.driver = MagicMock()
+        downloader.driver.get_cookies.return_value = [
+            {'name': '__session', 'value': 'jwt-token'},
+            {'name': '__client_uat', 'value': '123'},
+        ]
+
+        cookies = downloader.harvest_auth()
+
+        assert cookies == {'__session': 'jwt-token', '__client_uat': '123'}
+        assert downloader.session.headers['Authorization'] == 'Bearer jwt-token'
+        assert downloader.session.cookies['__client_uat'] == '123'
+
+    def test_harvest_auth_without_token(self, temp_download_dir):
+        """Test that a missing session cookie leaves no Authorization header"""
+        downloader = SunoDownloader("user@test.com", "password", download_dir=temp_download_dir)
+        downloader.driver = MagicMock()
+        downloader.driver.get_cookies.return_value = []
+
+        assert downloader.harvest_auth() == {}
+        assert 'Authorization' not in downloader.session.headers
+
+    def test_list_songs_api_pages_with_total(self, http_server, temp_download_dir):
+        """Test paging a feed that reports its total, de-duplicating by ID"""
+        self._serve_feed(http_server, [
+            [self._clip(0), self._clip(1)],
+            [self._clip(2), self._clip(1)],
+            [self._clip(3)],
+        ], total=5)
+        downloader = self._downloader(http_server, temp_download_dir, workers=3)
+        downloader.session.headers['Authorization'] = 'Bearer jwt-token'
+
+        songs = downloader.list_songs_api()
+
+        assert [s['id'] for s in songs] == ['clip0', 'clip1', 'clip2', 'clip3']
+        assert all(h.get('Authorization') == 'Bearer jwt-token'
+                   for _, _, h in http_server.requests)
+        assert len(http_server.requests) == 3
+
+    def test_list_songs_api_pages_until_empty(self, http_server, temp_download_dir):
+        """Test paging a list-style feed without a total until an empty page"""
+        self._serve_feed(http_server, [[self._clip(0)], [self._clip(1)], []], total=False)
+        downloader = self._downloader(http_server, temp_download_dir)
+
+        songs = downloader.list_songs_api({'title': 'song 1'})
+
+        assert [s['id'] for s in songs] == ['clip1']
+
+    def test_list_songs_api_empty_library(self, http_server, temp_download_dir):
+        """Test an empty first page"""
+        self._serve_feed(http_server, [[]], total=0)
+        downloader = self._downloader(http_server, temp_download_dir)
+
+        assert downloader.list_songs_api() == []
+
+    def test_list_songs_uses_api(self, temp_download_dir):
+        """Test that API listing skips navigating and scrolling the page"""
+        downloader = SunoDownloader("user@test.com", "password",
+                                    download_dir=temp_download_dir, listing='api')
+        downloader.driver = MagicMock()
+        songs = [{'id': 'clip1'}]
+
+        with patch.object(downloader, 'harvest_auth') as mock_auth, \
+                patch.object(downloader, 'list_songs_api', return_value=songs), \
+                patch.object(downloader, 'navigate_to_library') as mock_navigate:
+            assert downloader.list_songs({'title': 'x'}) == songs
+
+        mock_auth.assert_called_once()
+        mock_navigate.assert_not_called()
+
+    def test_list_songs_falls_back_to_browser(self, http_server, temp_download_dir):
+        """Test that a failing feed falls back to scrolling the library page"""
+        downloader = self._downloader(http_server, temp_download_dir, listing='api')
+        downloader.driver = MagicMock()
+        downloader.driver.get_cookies.return_value = []
+
+        with patch.object(downloader, 'navigate_to_library') as mock_navigate, \
+                patch.object(downloader, 'scroll_to_load_all_songs'), \
+                patch.object(downloader, 'extract_songs_data',
+                             return_value=[{'id': 'clip1'}]) as mock_extract:
+            assert downloader.list_songs() == [{'id': 'clip1'}]
+
+        mock_navigate.assert_called_once()
+        mock_extract.assert_called_once_with(None)
+
+
 class TestApplyFilters:
     """Test filter application"""
 
@@ -579,13 +1001,13 @@ class TestWaitForGeneration:
 class TestDownloadFile:
     """Test file downloading"""
 
-    @patch('automated_downloader.requests.get')
+    @patch('automated_downloader.requests.Session.get')
     def test_download_file_success(self, mock_get):
         """Test successful file download"""
         with tempfile.TemporaryDirectory() as tmpdir:
             # Mock response
             mock_response = MagicMock()
-            mock_response.headers.get.return_value = '1024'
+            mock_response.headers.get.return_value = '9'
             mock_response.iter_content.return_value = [b'test data']
             mock_response.raise_for_status.return_value = None
             mock_get.return_value = mock_response
@@ -601,7 +1023,7 @@ class TestDownloadFile:
             assert result is True
             assert os.path.exists(os.path.join(tmpdir, 'test.mp3'))
 
-    @patch('automated_downloader.requests.get')
+    @patch('automated_downloader.requests.Session.get')
     def test_download_file_already_exists(self, mock_get):
         """Test skipping download when file already exists"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -621,7 +1043,7 @@ class TestDownloadFile:
             assert result is True
             mock_get.assert_not_called()
 
-    @patch('automated_downloader.requests.get')
+    @patch('automated_downloader.requests.Session.get')
     def test_download_file_no_url(self, mock_get):
         """Test download with empty URL"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -632,7 +1054,7 @@ class TestDownloadFile:
             assert result is False
             mock_get.assert_not_called()
 
-    @patch('automated_downloader.requests.get')
+    @patch('automated_downloader.requests.Session.get')
     def test_download_file_request_failure(self, mock_get):
         """Test download with request failure"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -649,6 +1071,400 @@ class TestDownloadFile:
             assert result is False
 
 
+class TestHttpSession:
+    """Test pooled keep-alive HTTP sessions"""
+
+    def test_create_http_session_pool_size(self):
+        """Test that the session mounts a pooled adapter for both schemes"""
+        session = create_http_session(pool_size=7)
+
+        adapter = session.get_adapter('https://cdn.example.com/song.mp3')
+        assert adapter is session.get_adapter('http://cdn.example.com/song.mp3')
+        assert adapter._pool_connections == 7
+        assert adapter._pool_maxsize == 7
+
+    def test_connection_stats_empty_session(self):
+        """Test stats before any request is made"""
+        assert connection_stats(create_http_session()) == {'opened': 0, 'reused': 0}
+
+    def test_connection_stats_ignores_foreign_adapters(self):
+        """Test that adapters without a pool manager are skipped"""
+        session = create_http_session()
+        session.mount('mock://', object())
+
+        assert connection_stats(session) == {'opened': 0, 'reused': 0}
+
+    def test_download_file_reuses_connection(self, http_server):
+        """Test that consecutive downloads reuse one keep-alive connection"""
+        for i in range(3):
+            http_server.files[f'/song{i}.mp3'] = b'x' * 2048
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            downloader = SunoDownloader("user@test.com", "password", download_dir=tmpdir)
+
+            for i in range(3):
+                assert downloader.download_file(
+                    f'{http_server.url}/song{i}.mp3', f'song{i}.mp3', 'mp3'
+                )
+
+            assert connection_stats(downloader.session) == {'opened': 1, 'reused': 2}
+            downloader.session.close()
+
+
+class TestResumableDownload:
+    """Test .part files, HTTP Range resume and journal validation"""
+
+    def _write_partial(self, tmpdir, name, data, journal):
+        Path(tmpdir, name + '.part').write_bytes(data)
+        Path(tmpdir, name + '.part.json').write_text(json.dumps(journal))
+
+    def test_interrupted_download_resumes_from_offset(self, http_server):
+        """Test that a dropped transfer keeps its bytes and resumes with Range"""
+        body = os.urandom(300000)
+        http_server.files['/song.wav'] = body
+        http_server.etags['/song.wav'] = '"v1"'
+        http_server.truncate['/song.wav'] = 100000
+        url = f'{http_server.url}/song.wav'
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            downloader = SunoDownloader("user@test.com", "password", download_dir=tmpdir)
+
+            assert downloader.download_file(url, 'song.wav', 'wav') is False
+            assert not Path(tmpdir, 'song.wav').exists()
+            kept = Path(tmpdir, 'song.wav.part').stat().st_size
+            assert 0 < kept <= 100000
+            journal = json.loads(Path(tmpdir, 'song.wav.part.json').read_text())
+            assert journal['etag'] == '"v1"'
+            assert journal['total_size'] == 300000
+
+            assert downloader.download_file(url, 'song.wav', 'wav') is True
+            assert Path(tmpdir, 'song.wav').read_bytes() == body
+            assert not Path(tmpdir, 'song.wav.part').exists()
+            assert not Path(tmpdir, 'song.wav.part.json').exists()
+
+            resume_headers = http_server.requests[-1][2]
+            assert resume_headers['Range'] == f'bytes={kept}-'
+            assert resume_headers['If-Range'] == '"v1"'
+
+    def test_changed_remote_file_restarts(self, http_server):
+        """Test that an ETag change makes the server send the full new file"""
+        body = b'new content' * 100
+        http_server.files['/song.mp4'] = body
+        http_server.etags['/song.mp4'] = '"v2"'
+        url = f'{http_server.url}/song.mp4'
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._write_partial(tmpdir, 'song.mp4', b'old',
+                                {'url': url, 'etag': '"v1"', 'total_size': 5000})
+            downloader = SunoDownloader("user@test.com", "password", download_dir=tmpdir)
+
+            assert downloader.download_file(url, 'song.mp4', 'mp4') is True
+            assert Path(tmpdir, 'song.mp4').read_bytes() == body
+
+    def test_size_mismatch_on_resume_restarts(self, http_server):
+        """Test that a 206 whose total size disagrees with the journal restarts"""
+        body = b'z' * 4000
+        http_server.files['/song.mp3'] = body
+        url = f'{http_server.url}/song.mp3'
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._write_partial(tmpdir, 'song.mp3', b'q' * 1000,
+                                {'url': url, 'etag': '', 'total_size': 9999})
+            downloader = SunoDownloader("user@test.com", "password", download_dir=tmpdir)
+
+            assert downloader.download_file(url, 'song.mp3', 'mp3') is True
+            assert Path(tmpdir, 'song.mp3').read_bytes() == body
+            assert 'Range' in http_server.requests[0][2]
+            assert 'Range' not in http_server.requests[1][2]
+
+    def test_range_not_satisfiable_restarts(self, http_server):
+        """Test that a 416 discards the partial file and downloads from scratch"""
+        body = b'k' * 100
+        http_server.files['/song.mp3'] = body
+        url = f'{http_server.url}/song.mp3'
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._write_partial(tmpdir, 'song.mp3', b'k' * 500,
+                                {'url': url, 'etag': '', 'total_size': 100})
+            downloader = SunoDownloader("user@test.com", "password", download_dir=tmpdir)
+
+            assert downloader.download_file(url, 'song.mp3', 'mp3') is True
+            assert Path(tmpdir, 'song.mp3').read_bytes() == body
+
+    def test_partial_for_other_url_is_ignored(self, http_server):
+        """Test that a journal recorded for a different URL is not resumed"""
+        http_server.files['/song.mp3'] = b'fresh'
+        url = f'{http_server.url}/song.mp3'
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._write_partial(tmpdir, 'song.mp3', b'stale',
+                                {'url': 'http://elsewhere/song.mp3', 'etag': '"x"'})
+            downloader = SunoDownloader("user@test.com", "password", download_dir=tmpdir)
+
+            assert downloader.download_file(url, 'song.mp3', 'mp3') is True
+            assert Path(tmpdir, 'song.mp3').read_bytes() == b'fresh'
+            assert 'Range' not in http_server.requests[0][2]
+
+    def test_no_range_support_discards_partial(self, http_server):
+        """Test that partial bytes are not kept when the server cannot resume"""
+        http_server.accept_ranges = False
+        http_server.files['/song.mp3'] = b'm' * 50000
+        http_server.truncate['/song.mp3'] = 1000
+        url = f'{http_server.url}/song.mp3'
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            downloader = SunoDownloader("user@test.com", "password", download_dir=tmpdir)
+
+            assert downloader.download_file(url, 'song.mp3', 'mp3') is False
+            assert os.listdir(tmpdir) == []
+
+    def test_async_download_resumes(self, http_server):
+        """Test that the async engine resumes from the same .part journal"""
+        pytest.importorskip('aiohttp')
+        body = os.urandom(50000)
+        http_server.files['/song.wav'] = body
+        http_server.etags['/song.wav'] = '"v1"'
+        url = f'{http_server.url}/song.wav'
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._write_partial(tmpdir, 'Song.wav', body[:20000],
+                                {'url': url, 'etag': '"v1"', 'total_size': 50000})
+            downloader = SunoDownloader("user@test.com", "password", download_dir=tmpdir,
+                                        formats=['wav'], engine='async')
+            song = {'id': 'song1', 'title': 'Song', 'status': 'complete', 'audio_url': ''}
+
+            with patch.object(downloader, 'get_wav_url', return_value=url):
+                assert downloader._download_async([song], False) == {'song1': {'wav': True}}
+
+            assert Path(tmpdir, 'Song.wav').read_bytes() == body
+            assert http_server.requests[-1][2]['Range'] == 'bytes=20000-'
+
+    def test_async_download_restarts_on_416(self, http_server):
+        """Test that the async engine restarts when the range is not satisfiable"""
+        pytest.importorskip('aiohttp')
+        http_server.files['/song.mp3'] = b'short'
+        url = f'{http_server.url}/song.mp3'
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._write_partial(tmpdir, 'Song.mp3', b'much longer than the file',
+                                {'url': url, 'etag': '', 'total_size': 5})
+            downloader = SunoDownloader("user@test.com", "password", download_dir=tmpdir,
+                                        formats=['mp3'], engine='async')
+            song = {'id': 'song1', 'title': 'Song', 'status': 'complete', 'audio_url': url}
+
+            assert downloader._download_async([song], False) == {'song1': {'mp3': True}}
+            assert Path(tmpdir, 'Song.mp3').read_bytes() == b'short'
+
+    def test_commit_rejects_short_file(self):
+        """Test that a .part smaller than Content-Length is not moved into place"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            partial = PartialDownload(Path(tmpdir) / 'song.mp3')
+            partial.accept('http://example.com/song.mp3', 200,
+                           {'Content-Length': '10', 'Accept-Ranges': 'bytes'})
+            with partial.open() as f:
+                f.write(b'12345')
+
+            with pytest.raises(Exception, match="Incomplete download: got 5 of 10 bytes"):
+                partial.commit()
+
+            partial.abort()
+            assert Path(tmpdir, 'song.mp3.part').exists()
+
+    def test_abort_discards_oversized_partial(self):
+        """Test that a .part larger than the expected size is not kept for resume"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            partial = PartialDownload(Path(tmpdir) / 'song.mp3')
+            partial.accept('http://example.com/song.mp3', 200,
+                           {'Content-Length': '2', 'Accept-Ranges': 'bytes'})
+            with partial.open() as f:
+                f.write(b'12345')
+
+            partial.abort()
+            assert os.listdir(tmpdir) == []
+
+    def test_full_response_without_ranges_drops_stale_journal(self):
+        """Test that a stale journal is removed when the server stops offering ranges"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._write_partial(tmpdir, 'song.mp3', b'', {'url': 'x'})
+            partial = PartialDownload(Path(tmpdir) / 'song.mp3')
+
+            assert partial.accept('http://example.com/song.mp3', 200, {}) is True
+            assert not Path(tmpdir, 'song.mp3.part.json').exists()
+
+    def test_parse_helpers(self):
+        """Test Content-Range and integer header parsing"""
+        assert PartialDownload._parse_content_range('bytes 10-99/100') == (10, 100)
+        assert PartialDownload._parse_content_range(None) == (None, None)
+        assert PartialDownload._parse_int('abc') is None
+
+
+class TestDownloadManifest:
+    """Test the persistent JSONL download manifest"""
+
+    def test_record_and_reload(self, temp_download_dir):
+        """Test that records survive a reload and the latest record wins"""
+        download_dir = Path(temp_download_dir)
+        (download_dir / 'Song.mp3').write_bytes(b'abc')
+
+        manifest = DownloadManifest(download_dir)
+        manifest.record('clip1', 'mp3', 'Song.mp3', 'http://cdn/old.mp3', 'deadbeef')
+        manifest.record('clip1', 'mp3', 'Song.mp3', 'http://cdn/1.mp3')
+
+        reloaded = DownloadManifest(download_dir)
+        entry = reloaded.get('clip1', 'mp3')
+        assert entry['url'] == 'http://cdn/1.mp3'
+        assert entry['size'] == 3
+        assert entry['sha256'] == hashlib.sha256(b'abc').hexdigest()
+        assert reloaded.superseded == 1
+
+    def test_is_complete(self, temp_download_dir):
+        """Test completeness checks against URL and on-disk size"""
+        download_dir = Path(temp_download_dir)
+        (download_dir / 'Song.mp3').write_bytes(b'abc')
+        manifest = DownloadManifest(download_dir)
+        manifest.record('clip1', 'mp3', 'Song.mp3', 'http://cdn/1.mp3')
+
+        assert manifest.is_complete('clip1', 'mp3', 'http://cdn/1.mp3') is True
+        assert manifest.is_complete('clip1', 'mp3', 'http://cdn/changed.mp3') is False
+        assert manifest.is_complete('clip2', 'mp3', 'http://cdn/2.mp3') is False
+
+        (download_dir / 'Song.mp3').write_bytes(b'a')
+        assert manifest.is_complete('clip1', 'mp3', 'http://cdn/1.mp3') is False
+
+        (download_dir / 'Song.mp3').unlink()
+        assert manifest.is_complete('clip1', 'mp3', 'http://cdn/1.mp3') is False
+
+    def test_claim_disambiguates_shared_titles(self, temp_download_dir):
+        """Test that two clips with the same title get distinct filenames"""
+        download_dir = Path(temp_download_dir)
+        (download_dir / 'Song.mp3').write_bytes(b'abc')
+        manifest = DownloadManifest(download_dir)
+        manifest.record('clip1', 'mp3', 'Song.mp3', 'http://cdn/1.mp3')
+
+        assert manifest.claim('clip1', 'mp3', 'Renamed.mp3') == 'Song.mp3'
+        assert manifest.claim('clip2', 'mp3', 'Song.mp3') == 'Song clip2.mp3'
+        assert manifest.claim('clip3', 'mp4', 'Other.mp4') == 'Other.mp4'
+        assert manifest.claim('clip3', 'mp4', 'Other.mp4') == 'Other.mp4'
+
+    def test_corrupt_lines_are_skipped(self, temp_download_dir):
+        """Test that a torn write does not prevent loading the rest"""
+        download_dir = Path(temp_download_dir)
+        (download_dir / DownloadManifest.FILENAME).write_text(
+            json.dumps({'type': 'file', 'id': 'clip1', 'format': 'mp3',
+                        'path': 'Song.mp3', 'size': 1, 'url': 'u'}) + '\n{"type": "fi'
+        )
+
+        manifest = DownloadManifest(download_dir)
+
+        assert manifest.get('clip1', 'mp3')['path'] == 'Song.mp3'
+
+    def test_runs_and_compact(self, temp_download_dir):
+        """Test run records and compaction of superseded file records"""
+        download_dir = Path(temp_download_dir)
+        (download_dir / 'Song.mp3').write_bytes(b'abc')
+        manifest = DownloadManifest(download_dir)
+        assert manifest.last_run() is None
+
+        manifest.compact()
+        manifest.record('clip1', 'mp3', 'Song.mp3', 'u1', 'x')
+        manifest.record('clip1', 'mp3', 'Song.mp3', 'u2', 'y')
+        manifest.record_run('2025-01-01T00:00:00+00:00',
+                            {'clip1': {'mp3': True}, 'clip2': {'mp3': False}, 'clip3': {}})
+        manifest.compact()
+
+        lines = manifest.path.read_text().splitlines()
+        assert len(lines) == 2
+        reloaded = DownloadManifest(download_dir)
+        assert reloaded.get('clip1', 'mp3')['url'] == 'u2'
+        assert reloaded.last_run()['failed_ids'] == ['clip2', 'clip3']
+        assert reloaded.last_run()['success'] == 1
+
+    def test_download_file_records_and_skips_by_id(self, http_server, temp_download_dir):
+        """Test that a completed clip is skipped by ID without any request"""
+        http_server.files['/1.mp3'] = b'song bytes'
+        url = f'{http_server.url}/1.mp3'
+        downloader = SunoDownloader("user@test.com", "password", download_dir=temp_download_dir)
+
+        assert downloader.download_file(url, 'Song.mp3', 'mp3', 'clip1') is True
+        entry = downloader.manifest.get('clip1', 'mp3')
+        assert entry['sha256'] == hashlib.sha256(b'song bytes').hexdigest()
+        assert entry['size'] == 10
+
+        assert downloader.download_file(url, 'Song.mp3', 'mp3', 'clip1') is True
+        assert len(http_server.requests) == 1
+
+    def test_download_file_refreshes_changed_clip(self, http_server, temp_download_dir):
+        """Test that a clip whose URL changed is downloaded again over the old file"""
+        http_server.files['/v2.mp3'] = b'version two'
+        (Path(temp_download_dir) / 'Song.mp3').write_bytes(b'version one')
+        downloader = SunoDownloader("user@test.com", "password", download_dir=temp_download_dir)
+        downloader.manifest.record('clip1', 'mp3', 'Song.mp3', f'{http_server.url}/v1.mp3')
+
+        assert downloader.download_file(f'{http_server.url}/v2.mp3', 'Song.mp3', 'mp3', 'clip1')
+        assert (Path(temp_download_dir) / 'Song.mp3').read_bytes() == b'version two'
+
+    def test_download_file_adopts_existing_file(self, temp_download_dir):
+        """Test that files from before the manifest are recorded, not re-downloaded"""
+        (Path(temp_download_dir) / 'Song.mp3').write_bytes(b'legacy')
+        downloader = SunoDownloader("user@test.com", "password", download_dir=temp_download_dir)
+
+        assert downloader.download_file('http://cdn/1.mp3', 'Song.mp3', 'mp3', 'clip1') is True
+        assert downloader.manifest.is_complete('clip1', 'mp3', 'http://cdn/1.mp3')
+
+    def test_select_songs_skips_complete_clips(self, temp_download_dir):
+        """Test that songs complete in every requested format are dropped"""
+        (Path(temp_download_dir) / 'Done.mp3').write_bytes(b'abc')
+        downloader = SunoDownloader("user@test.com", "password",
+                                    download_dir=temp_download_dir, formats=['mp3'])
+        downloader.manifest.record('clip1', 'mp3', 'Done.mp3', 'http://cdn/1.mp3')
+        songs = [
+            {'id': 'clip1', 'title': 'Done', 'audio_url': 'http://cdn/1.mp3'},
+            {'id': 'clip2', 'title': 'New', 'audio_url': 'http://cdn/2.mp3'},
+            {'id': 'clip3', 'title': 'No Audio', 'audio_url': ''},
+        ]
+
+        selected = downloader._select_songs(songs, since_last_run=False)
+
+        assert [s['id'] for s in selected] == ['clip2', 'clip3']
+
+    def test_select_songs_since_last_run(self, temp_download_dir):
+        """Test incremental mode keeps new songs and the last run's failures"""
+        downloader = SunoDownloader("user@test.com", "password",
+                                    download_dir=temp_download_dir, formats=['mp3'])
+        downloader.manifest.record_run('2025-01-10T00:00:00+00:00', {'old-failed': {}})
+        songs = [
+            {'id': 'old', 'title': 'Old', 'audio_url': 'u1', 'created_at': '2025-01-01T00:00:00Z'},
+            {'id': 'old-failed', 'title': 'Retry', 'audio_url': 'u2',
+             'created_at': '2025-01-02T00:00:00Z'},
+            {'id': 'new', 'title': 'New', 'audio_url': 'u3', 'created_at': '2025-01-11T00:00:00Z'},
+            {'id': 'undated', 'title': 'Undated', 'audio_url': 'u4', 'created_at': ''},
+            {'id': 'naive', 'title': 'Naive', 'audio_url': 'u5', 'created_at': '2025-01-12T00:00:00'},
+        ]
+
+        selected = downloader._select_songs(songs, since_last_run=True)
+
+        assert [s['id'] for s in selected] == ['old-failed', 'new', 'undated', 'naive']
+        assert len(downloader._select_songs(songs, since_last_run=False)) == 5
+
+    def test_run_records_run(self, temp_download_dir):
+        """Test that run appends a run record and passes since_last_run through"""
+        downloader = SunoDownloader("user@test.com", "password", download_dir=temp_download_dir)
+        songs = [{'id': 'clip1', 'title': 'Song', 'status': 'complete'}]
+
+        with patch.object(downloader, 'setup_driver'), \
+                patch.object(downloader, 'login', return_value=True), \
+                patch.object(downloader, 'navigate_to_library'), \
+                patch.object(downloader, 'scroll_to_load_all_songs'), \
+                patch.object(downloader, 'extract_songs_data', return_value=songs), \
+                patch.object(downloader, '_select_songs', return_value=songs) as mock_select, \
+                patch.object(downloader, '_download_serially',
+                             return_value={'clip1': {'mp3': False}}):
+            downloader.run(since_last_run=True)
+
+        mock_select.assert_called_once_with(songs, True)
+        assert DownloadManifest(Path(temp_download_dir)).last_run()['failed_ids'] == ['clip1']
+
+
 class TestGetWavUrl:
     """Test WAV URL construction"""
 
@@ -680,14 +1496,14 @@ class TestGetWavUrl:
 class TestDownloadSong:
     """Test downloading a complete song"""
 
-    @patch('automated_downloader.requests.get')
+    @patch('automated_downloader.requests.Session.get')
     @patch('automated_downloader.webdriver.Chrome')
     def test_download_song_all_formats(self, mock_chrome, mock_get):
         """Test downloading all formats for a song"""
         with tempfile.TemporaryDirectory() as tmpdir:
             # Mock response
             mock_response = MagicMock()
-            mock_response.headers.get.return_value = '1024'
+            mock_response.headers.get.return_value = '9'
             mock_response.iter_content.return_value = [b'test data']
             mock_response.raise_for_status.return_value = None
             mock_get.return_value = mock_response
@@ -719,13 +1535,13 @@ class TestDownloadSong:
             assert results['mp3'] is True
             assert results['mp4'] is True
 
-    @patch('automated_downloader.requests.get')
+    @patch('automated_downloader.requests.Session.get')
     @patch('automated_downloader.webdriver.Chrome')
     def test_download_song_sanitize_filename(self, mock_chrome, mock_get):
         """Test filename sanitization"""
         with tempfile.TemporaryDirectory() as tmpdir:
             mock_response = MagicMock()
-            mock_response.headers.get.return_value = '1024'
+            mock_response.headers.get.return_value = '9'
             mock_response.iter_content.return_value = [b'test data']
             mock_response.raise_for_status.return_value = None
             mock_get.return_value = mock_response
@@ -751,8 +1567,8 @@ class TestDownloadSong:
 
             downloader.download_song(song, wait_for_gen=False)
 
-            # Check that file was created with sanitized name
-            files = os.listdir(tmpdir)
+            # Check that file was created with sanitized name (ignoring the manifest)
+            files = [f for f in os.listdir(tmpdir) if not f.startswith('.')]
             assert len(files) == 1
             assert '/' not in files[0]
             assert ':' not in files[0]
@@ -764,7 +1580,7 @@ class TestRun:
 
     @patch('automated_downloader.webdriver.Chrome')
     @patch('automated_downloader.time.sleep')
-    @patch('automated_downloader.requests.get')
+    @patch('automated_downloader.requests.Session.get')
     def test_run_complete_workflow(self, mock_get, mock_sleep, mock_chrome):
         """Test complete workflow"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -788,9 +1604,11 @@ class TestRun:
 
             # Mock scroll and extract
             call_count = [0]
-            def execute_script_handler(script):
+            def execute_script_handler(script, *args):
                 call_count[0] += 1
-                if 'scrollHeight' in script:
+                if 'clipCount' in script:
+                    return 1  # Clip count never grows, so scrolling ends
+                elif 'scrollHeight' in script:
                     return 1000  # Same height to end scrolling
                 elif 'scrollTo' in script:
                     return None
@@ -813,7 +1631,7 @@ class TestRun:
 
             # Mock download
             mock_response = MagicMock()
-            mock_response.headers.get.return_value = '1024'
+            mock_response.headers.get.return_value = '9'
             mock_response.iter_content.return_value = [b'test data']
             mock_response.raise_for_status.return_value = None
             mock_get.return_value = mock_response
@@ -854,8 +1672,10 @@ class TestRun:
         mock_wait.until.return_value = mock_email_input
 
         # Mock scroll and empty songs
-        def execute_script_handler(script):
-            if 'scrollHeight' in script:
+        def execute_script_handler(script, *args):
+            if 'clipCount' in script:
+                return 1  # Clip count never grows, so scrolling ends
+            elif 'scrollHeight' in script:
                 return 1000
             elif 'scrollTo' in script:
                 return None
@@ -892,6 +1712,349 @@ class TestRun:
         mock_driver.quit.assert_called_once()
 
 
+class TestDownloadEngine:
+    """Test the concurrent download worker pool"""
+
+    def test_engine_collects_results_per_song_and_format(self):
+        """Test that every queued job is reported under its song and format"""
+        download_func = MagicMock(side_effect=lambda url, filename, file_type, clip_id: 'bad' not in url)
+
+        engine = DownloadEngine(download_func, workers=3)
+        engine.start()
+        engine.submit('song1', 'mp3', 'http://cdn.example.com/1.mp3', '1.mp3')
+        engine.submit('song1', 'mp4', 'http://cdn.example.com/bad.mp4', '1.mp4')
+        engine.submit('song2', 'mp3', 'http://cdn.example.com/2.mp3', '2.mp3')
+        engine.track('song3')
+        results = engine.join()
+
+        assert results == {
+            'song1': {'mp3': True, 'mp4': False},
+            'song2': {'mp3': True},
+            'song3': {},
+        }
+        assert download_func.call_count == 3
+
+    def test_engine_worker_exception_marks_failure(self):
+        """Test that an exception in a job is recorded as a failed download"""
+        download_func = MagicMock(side_effect=Exception("Boom"))
+
+        engine = DownloadEngine(download_func, workers=2)
+        engine.start()
+        engine.submit('song1', 'mp3', 'http://cdn.example.com/1.mp3', '1.mp3')
+        results = engine.join()
+
+        assert results == {'song1': {'mp3': False}}
+
+    def test_engine_respects_per_host_limit(self):
+        """Test that concurrent transfers against one host never exceed the cap"""
+        import threading
+        import time as real_time
+
+        lock = threading.Lock()
+        active = {'cdn.example.com': 0, 'other.example.com': 0}
+        peak = {'cdn.example.com': 0, 'other.example.com': 0}
+
+        def download_func(url, filename, file_type, clip_id):
+            host = url.split('/')[2]
+            with lock:
+                active[host] += 1
+                peak[host] = max(peak[host], active[host])
+            real_time.sleep(0.02)
+            with lock:
+                active[host] -= 1
+            return True
+
+        engine = DownloadEngine(download_func, workers=6, per_host_limit=2)
+        engine.start()
+        for i in range(8):
+            engine.submit(f'a{i}', 'mp3', f'http://cdn.example.com/{i}.mp3', f'a{i}.mp3')
+            engine.submit(f'b{i}', 'mp3', f'http://other.example.com/{i}.mp3', f'b{i}.mp3')
+        results = engine.join()
+
+        assert len(results) == 16
+        assert peak['cdn.example.com'] <= 2
+        assert peak['other.example.com'] <= 2
+
+    def test_engine_minimum_one_worker(self):
+        """Test that worker counts below one are clamped"""
+        engine = DownloadEngine(MagicMock(), workers=0, per_host_limit=0)
+
+        assert engine.workers == 1
+        assert engine.per_host_limit == 1
+
+
+class TestRunConcurrent:
+    """Test run with a concurrent worker pool"""
+
+    def _songs(self):
+        return [
+            {'id': 'song1', 'title': 'First', 'status': 'complete',
+             'audio_url': 'http://example.com/1.mp3', 'video_url': 'http://example.com/1.mp4'},
+            {'id': 'song2', 'title': 'Second', 'status': 'processing',
+             'audio_url': 'http://example.com/2.mp3', 'video_url': ''},
+            {'id': 'song3', 'title': 'Third', 'status': 'complete',
+             'audio_url': '', 'video_url': ''},
+        ]
+
+    def test_download_concurrently_accounting(self):
+        """Test success/failure accounting matches the serial path"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            downloader = SunoDownloader("user@test.com", "password",
+                                        download_dir=tmpdir, formats=['mp3', 'mp4'],
+                                        workers=4)
+
+            with patch.object(downloader, 'download_file',
+                              side_effect=lambda url, filename, file_type, clip_id=None: bool(url)) as mock_download, \
+                    patch.object(downloader, 'wait_for_generation',
+                                 side_effect=lambda song: dict(song, status='complete')) as mock_wait:
+                results = downloader._download_concurrently(self._songs(), True)
+
+            assert results == {
+                'song1': {'mp3': True, 'mp4': True},
+                'song2': {'mp3': True, 'mp4': False},
+                'song3': {'mp3': False, 'mp4': False},
+            }
+            assert mock_download.call_count == 6
+            mock_wait.assert_called_once()
+
+    def test_download_concurrently_song_error(self):
+        """Test that an error while queueing a song counts as a failure"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            downloader = SunoDownloader("user@test.com", "password",
+                                        download_dir=tmpdir, formats=['mp3'],
+                                        workers=2)
+
+            with patch.object(downloader, 'download_file', return_value=True), \
+                    patch.object(downloader, 'wait_for_generation',
+                                 side_effect=Exception("Driver gone")):
+                results = downloader._download_concurrently(self._songs(), True)
+
+            assert results == {'song1': {'mp3': True}, 'song2': {}, 'song3': {'mp3': True}}
+
+    def test_run_uses_worker_pool(self, temp_download_dir):
+        """Test that run dispatches to the worker pool when workers > 1"""
+        downloader = SunoDownloader("user@test.com", "password",
+                                    download_dir=temp_download_dir, workers=3)
+        songs = self._songs()
+
+        with patch.object(downloader, 'setup_driver'), \
+                patch.object(downloader, 'login', return_value=True), \
+                patch.object(downloader, 'navigate_to_library'), \
+                patch.object(downloader, 'scroll_to_load_all_songs'), \
+                patch.object(downloader, 'extract_songs_data', return_value=songs), \
+                patch.object(downloader, '_download_concurrently',
+                             return_value={'song1': {'mp3': True}}) as mock_concurrent, \
+                patch.object(downloader, '_download_serially') as mock_serial:
+            downloader.run(wait_for_generation=False)
+
+        mock_concurrent.assert_called_once_with(songs, False)
+        mock_serial.assert_not_called()
+
+
+class TestPipeline:
+    """Test downloading while the library is still being listed"""
+
+    @staticmethod
+    def _song(song_id, status='complete', title=None):
+        return {'id': song_id, 'title': title or song_id.title(), 'status': status,
+                'audio_url': f'http://example.com/{song_id}.mp3', 'video_url': ''}
+
+    @patch('automated_downloader.time.sleep')
+    def test_iter_library_browser_yields_new_songs_per_scroll(self, mock_sleep):
+        """Test that each scroll extracts only the collection entries past the last count"""
+        collection = [self._song(f'song{i}') for i in range(1, 7)]
+        counts = iter([2, 4, 6])
+        last = [0]
+
+        def execute_script_handler(script, *args):
+            if 'clipCount' in script:
+                last[0] = next(counts, last[0])
+                return last[0]
+            if '__reactProps' in script:
+                return collection[args[0]:last[0]]
+            return None
+
+        downloader = SunoDownloader("user@test.com", "password",
+                                    timeouts={'scroll': 0.25})
+        downloader.driver = MagicMock()
+        downloader.driver.execute_script.side_effect = execute_script_handler
+
+        with patch.object(downloader, 'navigate_to_library') as mock_navigate:
+            batches = list(downloader.iter_library_browser())
+
+        mock_navigate.assert_called_once()
+        assert [[s['id'] for s in b] for b in batches] == [
+            ['song1', 'song2'], ['song3', 'song4'], ['song5', 'song6'], []]
+
+    def test_iter_library_api(self):
+        """Test that API listing streams feed pages"""
+        downloader = SunoDownloader("user@test.com", "password", listing='api')
+        downloader.driver = MagicMock()
+        pages = [[self._song('song1')], [self._song('song2')]]
+
+        with patch.object(downloader, 'harvest_auth') as mock_harvest, \
+                patch.object(downloader, 'iter_library_api', return_value=iter(pages)), \
+                patch.object(downloader, 'iter_library_browser') as mock_browser:
+            assert list(downloader.iter_library()) == pages
+
+        mock_harvest.assert_called_once()
+        mock_browser.assert_not_called()
+
+    def test_iter_library_api_falls_back_to_browser(self):
+        """Test that a failing feed continues with browser listing"""
+        downloader = SunoDownloader("user@test.com", "password", listing='api')
+
+        def failing_feed():
+            yield [self._song('song1')]
+            raise Exception("403 Forbidden")
+
+        with patch.object(downloader, 'iter_library_api', side_effect=failing_feed), \
+                patch.object(downloader, 'iter_library_browser',
+                             return_value=iter([[self._song('song1'), self._song('song2')]])):
+            batches = list(downloader.iter_library())
+
+        assert [[s['id'] for s in b] for b in batches] == [['song1'], ['song1', 'song2']]
+
+    def test_download_pipelined(self, temp_download_dir, caplog):
+        """Test de-duplication, filtering and deferring songs still generating"""
+        downloader = SunoDownloader("user@test.com", "password",
+                                    download_dir=temp_download_dir, formats=['mp3'],
+                                    workers=2, pipeline=True)
+        batches = [
+            [self._song('song1'), self._song('song2', status='streaming')],
+            [self._song('song1'), self._song('song3'), self._song('song4', title='Skip me')],
+        ]
+        events = []
+
+        def download_file(url, filename, file_type, clip_id=None):
+            events.append(('download', clip_id))
+            return True
+
+        def wait_for_generation(song):
+            events.append(('wait', song['id']))
+            return dict(song, status='complete')
+
+        with patch.object(downloader, 'iter_library', return_value=iter(batches)), \
+                patch.object(downloader, 'download_file', side_effect=download_file), \
+                patch.object(downloader, 'wait_for_generation', side_effect=wait_for_generation), \
+                caplog.at_level('INFO', logger='automated_downloader'):
+            results = downloader._download_pipelined({'title': 'song'}, False, True)
+
+        assert results == {'song1': {'mp3': True}, 'song2': {'mp3': True},
+                           'song3': {'mp3': True}}
+        downloads = [clip_id for event, clip_id in events if event == 'download']
+        assert sorted(downloads) == ['song1', 'song2', 'song3']
+        # The song still generating is only waited on after listing finished
+        assert events.index(('wait', 'song2')) > events.index(('download', 'song1'))
+        assert 'First file finished' in caplog.text
+
+    def test_run_pipeline_records_run(self, temp_download_dir):
+        """Test that run uses the pipeline and records the run in the manifest"""
+        downloader = SunoDownloader("user@test.com", "password",
+                                    download_dir=temp_download_dir, pipeline=True)
+
+        with patch.object(downloader, 'restore_session', return_value=True), \
+                patch.object(downloader, '_download_pipelined',
+                             return_value={'song1': {'mp3': False}}) as mock_pipeline, \
+                patch.object(downloader, 'list_songs') as mock_list:
+            downloader.run(wait_for_generation=False)
+
+        mock_pipeline.assert_called_once_with(None, False, False)
+        mock_list.assert_not_called()
+        assert downloader.manifest.last_run()['failed_ids'] == ['song1']
+
+    def test_pipeline_with_async_engine_warns(self, caplog):
+        """Test that pipeline mode notes it downloads with threads"""
+        with caplog.at_level('WARNING', logger='automated_downloader'):
+            SunoDownloader("user@test.com", "password", engine='async', pipeline=True)
+
+        assert 'threads engine' in caplog.text
+
+
+class TestAsyncEngine:
+    """Test the asyncio download engine"""
+
+    def test_download_async_against_local_server(self, http_server):
+        """Test that the async engine downloads, skips and fails like the serial path"""
+        pytest.importorskip('aiohttp')
+        http_server.files['/1.mp3'] = b'a' * 200000
+        http_server.files['/1.mp4'] = b'b' * 1000
+        http_server.files['/2.mp3'] = b'c' * 1000
+
+        songs = [
+            {'id': 'song1', 'title': 'First', 'status': 'complete',
+             'audio_url': f'{http_server.url}/1.mp3', 'video_url': f'{http_server.url}/1.mp4'},
+            {'id': 'song2', 'title': 'Second', 'status': 'complete',
+             'audio_url': f'{http_server.url}/2.mp3', 'video_url': f'{http_server.url}/missing.mp4'},
+            {'id': 'song3', 'title': 'Third', 'status': 'complete',
+             'audio_url': f'{http_server.url}/missing.mp3', 'video_url': ''},
+            {'id': 'song4', 'title': 'Fourth', 'status': 'complete',
+             'audio_url': f'{http_server.url}/4.mp3', 'video_url': ''},
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, 'Fourth.mp3').write_bytes(b'existing')
+            downloader = SunoDownloader("user@test.com", "password", download_dir=tmpdir,
+                                        formats=['mp3', 'mp4'], workers=50, engine='async')
+
+            results = downloader._download_async(songs, wait_for_generation=False)
+
+            assert results == {
+                'song1': {'mp3': True, 'mp4': True},
+                'song2': {'mp3': True, 'mp4': False},
+                'song3': {'mp3': False, 'mp4': False},
+                'song4': {'mp3': True, 'mp4': False},
+            }
+            assert Path(tmpdir, 'First.mp3').read_bytes() == b'a' * 200000
+            assert Path(tmpdir, 'First.mp4').read_bytes() == b'b' * 1000
+            assert Path(tmpdir, 'Second.mp3').exists()
+            assert not Path(tmpdir, 'Second.mp4').exists()
+            assert not Path(tmpdir, 'Third.mp3').exists()
+            assert Path(tmpdir, 'Fourth.mp3').read_bytes() == b'existing'
+            assert not any(path == '/4.mp3' for _, path, _ in http_server.requests)
+
+    def test_download_async_song_error(self):
+        """Test that an error while queueing a song counts as a failure"""
+        pytest.importorskip('aiohttp')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            downloader = SunoDownloader("user@test.com", "password", download_dir=tmpdir,
+                                        engine='async')
+            songs = [{'id': 'song1', 'title': 'Pending', 'status': 'processing'}]
+
+            with patch.object(downloader, 'wait_for_generation',
+                              side_effect=Exception("Driver gone")):
+                assert downloader._download_async(songs, True) == {'song1': {}}
+
+    def test_download_async_requires_aiohttp(self):
+        """Test a clear error when aiohttp is not installed"""
+        downloader = SunoDownloader("user@test.com", "password", engine='async')
+        songs = [{'id': 'song1', 'title': 'Song', 'status': 'complete',
+                  'audio_url': 'http://example.com/1.mp3'}]
+
+        with patch.dict(sys.modules, {'aiohttp': None}):
+            with pytest.raises(ImportError, match="aiohttp"):
+                downloader._download_async(songs, False)
+
+    def test_run_uses_async_engine(self, temp_download_dir):
+        """Test that run dispatches to the async engine"""
+        downloader = SunoDownloader("user@test.com", "password", download_dir=temp_download_dir,
+                                    workers=3, engine='async')
+        songs = [{'id': 'song1', 'title': 'Song', 'status': 'complete'}]
+
+        with patch.object(downloader, 'setup_driver'), \
+                patch.object(downloader, 'login', return_value=True), \
+                patch.object(downloader, 'navigate_to_library'), \
+                patch.object(downloader, 'scroll_to_load_all_songs'), \
+                patch.object(downloader, 'extract_songs_data', return_value=songs), \
+                patch.object(downloader, '_download_async',
+                             return_value={'song1': {'mp3': True}}) as mock_async, \
+                patch.object(downloader, '_download_concurrently') as mock_threads:
+            downloader.run(wait_for_generation=False)
+
+        mock_async.assert_called_once_with(songs, False)
+        mock_threads.assert_not_called()
+
+
 class TestMain:
     """Test main function and CLI argument parsing"""
 
@@ -911,7 +2074,17 @@ class TestMain:
             password='password123',
             download_dir='downloads',
             headless=False,
-            formats=['mp3', 'mp4', 'wav']
+            formats=['mp3', 'mp4', 'wav'],
+            workers=4,
+            per_host_limit=4,
+            pool_size=10,
+            engine='threads',
+            listing='browser',
+            session_cache='~/.cache/suno-ai/session.json',
+            timeouts={},
+            max_scroll_attempts=None,
+            pipeline=False,
+            max_wait_time=300
         )
         mock_downloader.run.assert_called_once()
 
@@ -961,6 +2134,122 @@ class TestMain:
         assert 'title' in call_kwargs['filter_criteria']
         assert call_kwargs['filter_criteria']['title'] == 'love'
 
+    @patch('sys.argv', ['automated_downloader.py', '-u', 'test@example.com', '-p', 'password',
+                        '--workers', '8', '--per-host-limit', '2'])
+    @patch('automated_downloader.SunoDownloader')
+    def test_main_with_workers(self, mock_downloader_class):
+        """Test main passes worker pool settings to the downloader"""
+        from automated_downloader import main
+
+        main()
+
+        call_kwargs = mock_downloader_class.call_args[1]
+        assert call_kwargs['workers'] == 8
+        assert call_kwargs['per_host_limit'] == 2
+
+    @patch('sys.argv', ['automated_downloader.py', '-u', 'test@example.com', '-p', 'password',
+                        '--listing', 'api'])
+    @patch('automated_downloader.SunoDownloader')
+    def test_main_with_api_listing(self, mock_downloader_class):
+        """Test main passes the listing mode to the downloader"""
+        from automated_downloader import main
+
+        main()
+
+        assert mock_downloader_class.call_args[1]['listing'] == 'api'
+
+    @patch('sys.argv', ['automated_downloader.py', '-u', 'test@example.com', '-p', 'password',
+                        '--timeout', 'scroll=2.5', '--timeout', 'login=60'])
+    @patch('automated_downloader.SunoDownloader')
+    def test_main_with_timeouts(self, mock_downloader_class):
+        """Test main parses page wait timeouts"""
+        from automated_downloader import main
+
+        mock_downloader_class.DEFAULT_TIMEOUTS = SunoDownloader.DEFAULT_TIMEOUTS
+        main()
+
+        assert mock_downloader_class.call_args[1]['timeouts'] == {'scroll': 2.5, 'login': 60.0}
+
+    @patch('sys.argv', ['automated_downloader.py', '-u', 'test@example.com', '-p', 'password',
+                        '--pipeline'])
+    @patch('automated_downloader.SunoDownloader')
+    def test_main_with_pipeline(self, mock_downloader_class):
+        """Test main enables pipeline mode"""
+        from automated_downloader import main
+
+        main()
+
+        assert mock_downloader_class.call_args[1]['pipeline'] is True
+
+    @patch('sys.argv', ['automated_downloader.py', '-u', 'test@example.com', '-p', 'password',
+                        '--max-scroll-attempts', '50'])
+    @patch('automated_downloader.SunoDownloader')
+    def test_main_with_max_scroll_attempts(self, mock_downloader_class):
+        """Test main passes the scroll attempt limit"""
+        from automated_downloader import main
+
+        main()
+
+        assert mock_downloader_class.call_args[1]['max_scroll_attempts'] == 50
+
+    @pytest.mark.parametrize('value', ['bogus=1', 'scroll=fast'])
+    @patch('automated_downloader.SunoDownloader')
+    def test_main_rejects_bad_timeouts(self, mock_downloader_class, value):
+        """Test main rejects unknown timeout names and non-numeric values"""
+        from automated_downloader import main
+
+        mock_downloader_class.DEFAULT_TIMEOUTS = SunoDownloader.DEFAULT_TIMEOUTS
+        argv = ['automated_downloader.py', '-u', 'test@example.com', '-p', 'password',
+                '--timeout', value]
+        with patch('sys.argv', argv), pytest.raises(SystemExit):
+            main()
+
+        mock_downloader_class.assert_not_called()
+
+    @patch('sys.argv', ['automated_downloader.py', '-u', 'test@example.com', '-p', 'password',
+                        '--no-session-cache'])
+    @patch('automated_downloader.SunoDownloader')
+    def test_main_without_session_cache(self, mock_downloader_class):
+        """Test main can disable the session cache"""
+        from automated_downloader import main
+
+        main()
+
+        assert mock_downloader_class.call_args[1]['session_cache'] is None
+
+    @patch('sys.argv', ['automated_downloader.py', '-u', 'test@example.com', '-p', 'password',
+                        '--session-cache', 'custom/session.json'])
+    @patch('automated_downloader.SunoDownloader')
+    def test_main_with_session_cache_path(self, mock_downloader_class):
+        """Test main passes a custom session cache path"""
+        from automated_downloader import main
+
+        main()
+
+        assert mock_downloader_class.call_args[1]['session_cache'] == 'custom/session.json'
+
+    @patch('sys.argv', ['automated_downloader.py', '-u', 'test@example.com', '-p', 'password',
+                        '--since-last-run'])
+    @patch('automated_downloader.SunoDownloader')
+    def test_main_with_since_last_run(self, mock_downloader_class):
+        """Test main enables incremental mode on run"""
+        from automated_downloader import main
+
+        main()
+
+        assert mock_downloader_class.return_value.run.call_args[1]['since_last_run'] is True
+
+    @patch('sys.argv', ['automated_downloader.py', '-u', 'test@example.com', '-p', 'password',
+                        '--engine', 'async'])
+    @patch('automated_downloader.SunoDownloader')
+    def test_main_with_async_engine(self, mock_downloader_class):
+        """Test main passes the engine choice to the downloader"""
+        from automated_downloader import main
+
+        main()
+
+        assert mock_downloader_class.call_args[1]['engine'] == 'async'
+
     @patch('sys.argv', ['automated_downloader.py'])
     @patch('sys.exit')
     @patch('automated_downloader.webdriver.Chrome')
@@ -114,11 +114,18 @@ class TestWaitForGenerationExtended:
 
         mock_time.side_effect = get_time
 
-        # First call returns processing, second returns complete
-        mock_driver.execute_script.side_effect = [
+        # First extraction returns processing, second returns complete
+        extractions = iter([
             [{'id': 'song1', 'title': 'Test', 'status': 'processing'}],
             [{'id': 'song1', 'title': 'Test', 'status': 'complete'}]
-        ]
+        ])
+
+        def execute_script_handler(script, *args):
+            if 'readyState' in script:
+                return True  # Network idle
+            return next(extractions)
+
+        mock_driver.execute_script.side_effect = execute_script_handler
 
         downloader = SunoDownloader("user@test.com", "password")
         downloader.setup_driver()
@@ -133,7 +140,7 @@ class TestWaitForGenerationExtended:
 class TestDownloadFileExtended:
     """Extended download file tests"""
 
-    @patch('automated_downloader.requests.get')
+    @patch('automated_downloader.requests.Session.get')
     def test_download_large_file_progress(self, mock_get):
         """Test downloading large file with progress logging"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -157,7 +164,7 @@ class TestDownloadFileExtended:
 
             assert result is True
 
-    @patch('automated_downloader.requests.get')
+    @patch('automated_downloader.requests.Session.get')
     def test_download_file_cleanup_on_error(self, mock_get):
         """Test that partial files are cleaned up on error"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -184,7 +191,7 @@ class TestDownloadFileExtended:
             # File should not exist after cleanup
             assert not test_file.exists()
 
-    @patch('automated_downloader.requests.get')
+    @patch('automated_downloader.requests.Session.get')
     def test_download_file_with_empty_chunks(self, mock_get):
         """Test downloading file with some empty chunks"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -211,7 +218,7 @@ class TestDownloadFileExtended:
 class TestDownloadSongExtended:
     """Extended download song tests"""
 
-    @patch('automated_downloader.requests.get')
+    @patch('automated_downloader.requests.Session.get')
     @patch('automated_downloader.webdriver.Chrome')
     @patch('automated_downloader.time.sleep')
     @patch('automated_downloader.time.time')
@@ -239,7 +246,7 @@ class TestDownloadSongExtended:
 
             # Mock download
             mock_response = MagicMock()
-            mock_response.headers.get.return_value = '1024'
+            mock_response.headers.get.return_value = '9'
             mock_response.iter_content.return_value = [b'test data']
             mock_response.raise_for_status.return_value = None
             mock_get.return_value = mock_response
@@ -259,7 +266,7 @@ class TestDownloadSongExtended:
 
             assert 'mp3' in results
 
-    @patch('automated_downloader.requests.get')
+    @patch('automated_downloader.requests.Session.get')
     @patch('automated_downloader.webdriver.Chrome')
     def test_download_song_with_all_formats(self, mock_chrome, mock_get):
         """Test downloading song with all three formats"""
@@ -270,7 +277,7 @@ class TestDownloadSongExtended:
 
             # Mock download
             mock_response = MagicMock()
-            mock_response.headers.get.return_value = '1024'
+            mock_response.headers.get.return_value = '9'
             mock_response.iter_content.return_value = [b'test data']
             mock_response.raise_for_status.return_value = None
             mock_get.return_value = mock_response
@@ -300,7 +307,7 @@ class TestRunExtended:
 
     @patch('automated_downloader.webdriver.Chrome')
     @patch('automated_downloader.time.sleep')
-    @patch('automated_downloader.requests.get')
+    @patch('automated_downloader.requests.Session.get')
     def test_run_with_failed_downloads(self, mock_get, mock_sleep, mock_chrome):
         """Test run with some failed downloads"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -322,8 +329,10 @@ class TestRunExtended:
             mock_wait.until.return_value = mock_email_input
 
             # Mock scroll and songs with no URLs (will fail download)
-            def execute_script_handler(script):
-                if 'scrollHeight' in script:
+            def execute_script_handler(script, *args):
+                if 'clipCount' in script:
+                    return 1  # Clip count never grows, so scrolling ends
+                elif 'scrollHeight' in script:
                     return 1000
                 elif 'scrollTo' in script:
                     return None
@@ -370,8 +379,10 @@ class TestRunExtended:
         mock_wait = MagicMock()
         mock_wait.until.return_value = mock_email_input
 
-        def execute_script_handler(script):
-            if 'scrollHeight' in script:
+        def execute_script_handler(script, *args):
+            if 'clipCount' in script:
+                return 1  # Clip count never grows, so scrolling ends
+            elif 'scrollHeight' in script:
                 return 1000
             elif 'scrollTo' in script:
                 return None